@@ -14,42 +14,56 @@ Round-trip serialization/deserialization of any Python object to/from any serial
 """
 
 import abc
+import contextlib
 import copy
 import dataclasses
 import datetime
 import enum
+import functools
 import importlib
-import importlib.metadata
 import inspect
 import io
 import logging
+import operator
 import uuid
 from collections.abc import Iterable, Iterator
 from typing import (
+    TYPE_CHECKING,
     Any,
     BinaryIO,
     Callable,
+    ClassVar,
     Dict,
+    FrozenSet,
     List,
     Optional,
+    Tuple,
     Type,
     TypeVar,
     Union,
     cast,
 )
 
-import avro.schema
-import dateutil.parser
 import memoization
 import more_itertools
 import orjson
-import py_avro_schema as pas
 
-import py_adapter._schema
 import py_adapter.plugin
 
-#: Library version, e.g. 1.0.0, taken from Git tags
-__version__ = importlib.metadata.version("py-adapter")
+if TYPE_CHECKING:
+    # Heavy imports only required when deserializing to Python objects, these are imported on demand
+    import avro.schema
+
+
+def __getattr__(name: str) -> Any:
+    """Return module attributes which are computed on first access"""
+    if name == "__version__":
+        import importlib.metadata
+
+        # Library version, e.g. 1.0.0, taken from Git tags
+        version = globals()["__version__"] = importlib.metadata.version("py-adapter")
+        return version
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 logger = logging.getLogger(__package__)
@@ -61,6 +75,16 @@ Record = Dict[str, "Basic"]
 Array = List["Basic"]
 Basic = Union[Primitives, Logicals, Array, Record]
 
+#: Types of objects which are converted as is, used to avoid dispatching on simple values inside containers
+_PRIMITIVE_TYPES = frozenset([type(None), bool, str, int, float])
+#: Types of objects which cannot be modified and therefore do not need copying when converting
+_IMMUTABLE_TYPES = frozenset([type(None), bool, str, bytes, int, float, datetime.time])
+#: Size of the buffer for writing to unbuffered streams
+_BUFFER_SIZE = 64 * 1024
+#: Unix epoch, used to convert datetime objects to timestamps
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+_MILLISECOND = datetime.timedelta(milliseconds=1)
+
 
 # TODO: support datetime as nanosecond integer
 def to_basic_type(obj: Any, *, datetime_type: Type = datetime.datetime, json_type: Type = str) -> Basic:
@@ -81,6 +105,25 @@ def to_basic_type(obj: Any, *, datetime_type: Type = datetime.datetime, json_typ
     return data_dict
 
 
+def to_basic_type_many(
+    objs: Iterable[Any], *, datetime_type: Type = datetime.datetime, json_type: Type = str
+) -> Iterator[Basic]:
+    """
+    Convert multiple objects into data structures using "basic" types only as a pre-serialization step.
+
+    Objects are converted lazily as the returned iterator is consumed, using a single adapter for all objects.
+
+    :param objs:          The objects to convert
+    :param datetime_type: The type to convert datetime objects to. See :func:`to_basic_type`.
+    :param json_type:     The type to convert dataclass "JSON" dict fields to. See :func:`to_basic_type`.
+    """
+    adapter = _DictAdapter(
+        datetime_type=datetime_type,
+        json_type=json_type,
+    )
+    return map(adapter.adapt, objs)
+
+
 Obj = TypeVar("Obj")
 
 
@@ -96,6 +139,17 @@ def from_basic_type(basic_obj: Basic, py_type: Type[Obj]) -> Obj:
     return obj
 
 
+def clear_schema_cache() -> None:
+    """
+    Clear cached schemas generated for Python classes and classes imported when deserializing
+
+    This is only required if classes are redefined at runtime, e.g. when reloading modules.
+    """
+    _py_type_schema.cache_clear()
+    _import_existing_class.cache_clear()
+    _ObjectAdapter._import_attribute.cache_clear()
+
+
 def serialize(obj: Any, *, format: str, writer_schema: bytes = b"") -> bytes:
     """
     Serialize an object using a serialization format supported by **py-adapter**
@@ -106,8 +160,7 @@ def serialize(obj: Any, *, format: str, writer_schema: bytes = b"") -> bytes:
     """
     data_stream = io.BytesIO()
     serialize_to_stream(obj, data_stream, format=format, writer_schema=writer_schema)
-    data_stream.seek(0)
-    data = data_stream.read()
+    data = data_stream.getvalue()
     return data
 
 
@@ -115,6 +168,8 @@ def serialize_to_stream(obj: Any, stream: BinaryIO, *, format: str, writer_schem
     """
     Serialize an object to a file-like object using a serialization format supported by **py-adapter**
 
+    The stream is not flushed, this is left to the caller.
+
     :param obj:           Python object to serialize
     :param stream:        File like object to write the serialized data into
     :param format:        Serialization format as supported by a **py-adapter** plugin, e.g. ``JSON``.
@@ -123,7 +178,8 @@ def serialize_to_stream(obj: Any, stream: BinaryIO, *, format: str, writer_schem
     serialize_fn = py_adapter.plugin.plugin_hook(format, "serialize")
     basic_obj = to_basic_type(obj)
     py_type = type(obj)
-    serialize_fn(obj=basic_obj, stream=stream, py_type=py_type, writer_schema=writer_schema)
+    with _buffered(stream) as buffered_stream:
+        serialize_fn(obj=basic_obj, stream=buffered_stream, py_type=py_type, writer_schema=writer_schema)
 
 
 def serialize_many(objs: Iterable[Any], *, format: str, writer_schema: bytes = b"") -> bytes:
@@ -136,8 +192,7 @@ def serialize_many(objs: Iterable[Any], *, format: str, writer_schema: bytes = b
     """
     data_stream = io.BytesIO()
     serialize_many_to_stream(objs, data_stream, format=format, writer_schema=writer_schema)
-    data_stream.seek(0)
-    data = data_stream.read()
+    data = data_stream.getvalue()
     return data
 
 
@@ -145,6 +200,8 @@ def serialize_many_to_stream(objs: Iterable[Any], stream: BinaryIO, *, format: s
     """
     Serialize multiple objects to a file-like object using a serialization format supported by **py-adapter**
 
+    The stream is not flushed, this is left to the caller.
+
     :param objs:          Python objects to serialize
     :param stream:        File like object to write the serialized data into
     :param format:        Serialization format as supported by a **py-adapter** plugin, e.g. ``JSON``.
@@ -154,8 +211,27 @@ def serialize_many_to_stream(objs: Iterable[Any], stream: BinaryIO, *, format: s
     # Use the first object to find the class, assuming all objects share the same type
     (first_obj,), objs = more_itertools.spy(objs)  # This will fail if the iterable is empty
     py_type = type(first_obj)
-    basic_objs = (to_basic_type(obj) for obj in objs)
-    serialize_fn(objs=basic_objs, stream=stream, py_type=py_type, writer_schema=writer_schema)
+    # Objects are converted lazily such that plugins can stream them
+    basic_objs = to_basic_type_many(objs)
+    with _buffered(stream) as buffered_stream:
+        serialize_fn(objs=basic_objs, stream=buffered_stream, py_type=py_type, writer_schema=writer_schema)
+
+
+@contextlib.contextmanager
+def _buffered(stream: BinaryIO) -> Iterator[BinaryIO]:
+    """
+    Wrap an unbuffered (raw) stream such that plugins' small writes do not each result in a system call
+
+    Buffered data is flushed to the raw stream on exit, without closing the raw stream. Other streams are used as is.
+    """
+    if not isinstance(stream, io.RawIOBase):
+        yield stream
+        return
+    buffered_stream = io.BufferedWriter(stream, buffer_size=_BUFFER_SIZE)
+    try:
+        yield cast(BinaryIO, buffered_stream)
+    finally:
+        buffered_stream.detach()  # Flushes the buffer
 
 
 def deserialize(
@@ -226,6 +302,9 @@ def deserialize_many_from_stream(
     Deserialize a file-like object as an iterator over Python objects of a given type from a serialization format
     supported by **py-adapter**
 
+    Objects may be read from the stream as the returned iterator is consumed. The stream must therefore stay open until
+    all objects have been consumed.
+
     :param stream:        File-like object to deserialize
     :param py_type:       The Python class to create an instance from
     :param format:        Serialization format as supported by a **py-adapter** plugin, e.g. ``JSON``.
@@ -282,71 +361,142 @@ class _DictAdapter(_Adapter):
 
         :param data: The object to convert
         """
-        if dataclasses.is_dataclass(data):
-            return self._adapt_dataclass(data)
-        elif isinstance(data, (list, tuple)):
-            return list(self.adapt(v) for v in data)  # Additional logic: always use list
-        elif isinstance(data, dict):
-            # Modified: excluding private keys
-            return type(data)(
-                (self.adapt(k), self.adapt(v))
-                for k, v in data.items()
-                if not k.startswith("_") or self.incl_private_keys
-            )
-        elif isinstance(data, enum.Enum):  # Additional logic
-            return data.value
-        elif isinstance(data, datetime.datetime):
-            return self._adapt_datetime(data)  # Additional logic
-        elif isinstance(data, datetime.date):
-            return self._adapt_date(data)  # Additional logic
-        elif isinstance(data, str):
-            return str(data)  # Additional logic, it might be a string subclass
-        elif isinstance(data, uuid.UUID):  # Additional logic
-            # TODO: introduce setting for UUID to str conversion, some serializer can work with UUID objects directly
-            return str(data)
+        method_name = self._cached_adapt_method_name(self.__class__, data.__class__)
+        return getattr(self, method_name)(data)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _cached_adapt_method_name(adapter_class: Type["_DictAdapter"], data_type: Type) -> str:
+        """Return the name of the method for an adapter class to convert objects of a given type, cached"""
+        return adapter_class._adapt_method_name(data_type)
+
+    @staticmethod
+    def _adapt_method_name(data_type: Type) -> str:
+        """Return the name of the method to convert objects of a given type"""
+        if data_type in _IMMUTABLE_TYPES:  # Exact types only, subclasses such as str enums need converting
+            return "_adapt_immutable"
+        elif dataclasses.is_dataclass(data_type):
+            return "_adapt_dataclass"
+        elif issubclass(data_type, (list, tuple)):
+            return "_adapt_list"
+        elif issubclass(data_type, dict):
+            return "_adapt_dict"
+        elif issubclass(data_type, enum.Enum):  # Additional logic
+            return "_adapt_enum"
+        elif issubclass(data_type, datetime.datetime):  # Additional logic
+            return "_adapt_datetime"
+        elif issubclass(data_type, datetime.date):  # Additional logic
+            return "_adapt_date"
+        elif issubclass(data_type, str):  # Additional logic
+            return "_adapt_str"
+        elif issubclass(data_type, uuid.UUID):  # Additional logic
+            return "_adapt_uuid"
         else:
-            try:
-                # TODO: try dict(data) first
-                return self.adapt(
-                    {k: v for k, v in vars(data).items() if not k.startswith("_") or self.incl_private_fields}
-                )  # Additional logic
-            except TypeError:
-                return copy.deepcopy(data)
+            return "_adapt_object"
+
+    def _adapt_list(self, data: Union[list, tuple]) -> Array:
+        """Recursively convert a list or tuple"""
+        adapt = self.adapt
+        return [v if type(v) in _PRIMITIVE_TYPES else adapt(v) for v in data]  # Additional logic: always use list
+
+    def _adapt_dict(self, data: dict) -> Record:
+        """Recursively convert a dict"""
+        adapt = self.adapt
+        # Modified: excluding private keys
+        return type(data)(
+            (
+                k if type(k) in _PRIMITIVE_TYPES else adapt(k),
+                v if type(v) in _PRIMITIVE_TYPES else adapt(v),
+            )
+            for k, v in data.items()
+            if not k.startswith("_") or self.incl_private_keys
+        )
+
+    @staticmethod
+    def _adapt_enum(data: enum.Enum) -> Basic:
+        """Convert an enum member"""
+        return data.value
+
+    @staticmethod
+    def _adapt_str(data: str) -> str:
+        """Convert a string, it might be a string subclass"""
+        return str(data)
+
+    @staticmethod
+    def _adapt_uuid(data: uuid.UUID) -> str:
+        """Convert a UUID object"""
+        # TODO: introduce setting for UUID to str conversion, some serializer can work with UUID objects directly
+        return str(data)
+
+    @staticmethod
+    def _adapt_immutable(data: Any) -> Any:
+        """Return an immutable object as is, there is no need to copy it"""
+        return data
+
+    def _adapt_object(self, data: Any) -> Basic:
+        """Convert any other object using its attributes, if it has any"""
+        # Private attributes are included only if both private fields and private dictionary keys are included, as if
+        # the attributes were adapted as a dictionary.
+        incl_private = self.incl_private_fields and self.incl_private_keys
+        adapt = self.adapt
+        try:
+            # TODO: try dict(data) first
+            return {
+                k: v if type(v) in _PRIMITIVE_TYPES else adapt(v)
+                for k, v in vars(data).items()
+                if incl_private or not k.startswith("_")
+            }
+        except TypeError:
+            return copy.deepcopy(data)
 
     def _adapt_date(self, data: datetime.date) -> Union[Primitives, Logicals]:
         """Convert a date object"""
         if self.datetime_type == int:
             start_of_day = datetime.datetime.combine(data, datetime.time(), tzinfo=datetime.timezone.utc)
-            return int(start_of_day.timestamp() * 1e3)  # Hardcode to timestamp in milliseconds for now
+            return (start_of_day - _EPOCH) // _MILLISECOND  # Hardcode to timestamp in milliseconds for now
         elif self.datetime_type == str:
             return data.isoformat()
         else:
-            return copy.deepcopy(data)
+            return data  # Immutable, no need to copy
 
     def _adapt_datetime(self, data: datetime.datetime) -> Union[Primitives, Logicals]:
         """Convert a datetime object"""
         if self.datetime_type == int:
-            return int(data.timestamp() * 1e3)  # Hardcode to timestamp in milliseconds for now
+            if data.tzinfo is None:
+                data = data.astimezone()  # Naive datetimes are assumed to be local time, like datetime.timestamp()
+            # Integer arithmetic avoids floating point rounding errors
+            return (data - _EPOCH) // _MILLISECOND  # Hardcode to timestamp in milliseconds for now
         elif self.datetime_type == str:
             return data.isoformat()
         else:
-            return copy.deepcopy(data)
+            return data  # Immutable, no need to copy
 
     def _adapt_dataclass(self, data: Any) -> Record:
         """Recursively convert a dataclass object with all fields"""
-        result = []
-        for f in dataclasses.fields(data):
-            # Additional logic
-            value: Basic
-            field_meta = f.metadata.get(__package__)  # Retrieve dataclass field meta data relevant to current pkg
-            if field_meta and field_meta.get("logical_type", "") == "json" and self.json_type == str:
-                # If this is a Python dict field with logical type JSON, encode data as JSON
-                value = orjson.dumps(getattr(data, f.name)).decode(encoding="utf-8")
-            else:
-                # Otherwise recursively adapt the field value as normal
-                value = self.adapt(getattr(data, f.name))
-            result.append((f.name, value))
-        return dict(result)
+        adapt = self.adapt
+        fields, json_field_names = _dataclass_fields(data.__class__)
+        if not json_field_names or self.json_type != str:
+            # Recursively adapt the field values as normal, unless it's a primitive which we can take as is
+            return {
+                name: value if type(value) in _PRIMITIVE_TYPES else adapt(value)
+                for name, getter in fields
+                for value in (getter(data),)
+            }
+        return {
+            # Additional logic: if this is a Python dict field with logical type JSON, encode data as JSON
+            name: (
+                self._adapt_json(value)
+                if name in json_field_names
+                else (value if type(value) in _PRIMITIVE_TYPES else adapt(value))
+            )
+            for name, getter in fields
+            for value in (getter(data),)
+        }
+
+    @staticmethod
+    def _adapt_json(data: Any) -> str:
+        """Encode the value of a JSON logical type field as a JSON string"""
+        return orjson.dumps(data).decode(encoding="utf-8")
 
 
 class _ObjectAdapter(_Adapter):
@@ -358,14 +508,44 @@ class _ObjectAdapter(_Adapter):
     module_schema_attribute: str = "pyModule"
     #: Avro schema attribute for constructing Python objects (e.g. string subclasses) for Avro string primitive schemas.
     named_string_attribute: str = "namedString"
+    #: Parser functions by Avro schema class, shared by all adapters. Populated on first use as Avro is imported on
+    #: demand. Parsers are plain functions taking the adapter as first argument, adapters do not reference themselves.
+    # TODO: improve type hints, third callable argument must be a schema object
+    _parsers_by_schema: ClassVar[Dict[Type["avro.schema.Schema"], Callable[["_ObjectAdapter", Any, Any], Any]]] = {}
 
-    def __init__(self, schema: avro.schema.Schema):
+    def __init__(self, schema: "avro.schema.Schema"):
         """
         An adapter to convert a dict into a Python object using an Avro schema
 
         :param schema: The Avro schema to be used to adapt the data structure.
         """
         self.schema = schema
+        if not self._parsers_by_schema:
+            self._register_parsers()
+
+    @staticmethod
+    def _register_parsers() -> None:
+        """
+        Populate the table of parser functions by Avro schema class
+
+        This also imports the modules the parsers need, once only rather than for every adapter.
+        """
+        import avro.schema
+
+        import py_adapter._schema  # noqa: F401  Used when parsing unions
+
+        _ObjectAdapter._parsers_by_schema.update(
+            {
+                avro.schema.ArraySchema: _ObjectAdapter._parse_array,
+                avro.schema.EnumSchema: _ObjectAdapter._parse_enum,
+                avro.schema.UnionSchema: _ObjectAdapter._parse_union,
+                avro.schema.RecordSchema: _ObjectAdapter._parse_record,
+                avro.schema.TimestampMillisSchema: _ObjectAdapter._parse_timestamp_millis,
+                avro.schema.DateSchema: _ObjectAdapter._parse_date,
+                avro.schema.PrimitiveSchema: _ObjectAdapter._parse_primitive,
+                avro.schema.UUIDSchema: _ObjectAdapter._parse_uuid,
+            }
+        )
 
     @classmethod
     def for_py_type(cls, py_type: Type) -> "_ObjectAdapter":
@@ -374,14 +554,7 @@ class _ObjectAdapter(_Adapter):
 
         :param py_type: The Python class to return an object adapter for
         """
-        try:
-            # TODO: expose options as necessary
-            schema = avro.schema.parse(
-                pas.generate(py_type, options=pas.Option.LOGICAL_JSON_STRING | pas.Option.MILLISECONDS).decode("utf-8")
-            )
-        except pas.TypeNotSupportedError:
-            raise TypeError(f"{py_type} not supported by py-adapter since it is not supported by py-avro-schema")
-        return cls(schema)
+        return cls(_py_type_schema(py_type))
 
     def adapt(self, data: Basic) -> Any:
         """
@@ -391,26 +564,15 @@ class _ObjectAdapter(_Adapter):
         """
         return self._parse(data, self.schema)
 
-    def _parse(self, data: Basic, schema: avro.schema.Schema) -> Any:
+    def _parse(self, data: Basic, schema: "avro.schema.Schema") -> Any:
         """Main parser method, called recursively"""
-        # TODO: improve type hints, second callable argument must be a schema object
-        parsers_by_schema: Dict[Type[avro.schema.Schema], Callable[[Any, Any], Any]] = {
-            avro.schema.ArraySchema: self._parse_array,
-            avro.schema.EnumSchema: self._parse_enum,
-            avro.schema.UnionSchema: self._parse_union,
-            avro.schema.RecordSchema: self._parse_record,
-            avro.schema.TimestampMillisSchema: self._parse_timestamp_millis,
-            avro.schema.DateSchema: self._parse_date,
-            avro.schema.PrimitiveSchema: self._parse_primitive,
-            avro.schema.UUIDSchema: self._parse_uuid,
-        }
-        parser = parsers_by_schema.get(type(schema))
+        parser = self._parsers_by_schema.get(type(schema))
         if parser:
-            return parser(data, schema)
+            return parser(self, data, schema)
         else:
             return data
 
-    def _parse_primitive(self, data: Primitives, schema: avro.schema.PrimitiveSchema) -> Any:
+    def _parse_primitive(self, data: Primitives, schema: "avro.schema.PrimitiveSchema") -> Any:
         """
         Parse primitive data types
 
@@ -420,7 +582,7 @@ class _ObjectAdapter(_Adapter):
         if schema.type == "string" and isinstance(data, str):
             if schema.get_prop("logicalType") == "json":
                 try:
-                    return orjson.loads(data.encode(encoding="utf-8"))
+                    return orjson.loads(data)  # orjson accepts str, no need to encode first
                 except orjson.JSONDecodeError:  # Handling say empty string as input which is not valid JSON
                     # The Python object should infill the default value, e.g. dict or list.
                     # TODO: what happens if the Python object does not have a default?
@@ -432,7 +594,7 @@ class _ObjectAdapter(_Adapter):
                 return class_(data)  # Instantiate class, which must be a subclass of str
         return data  # Avro serializer handles the rest
 
-    def _parse_uuid(self, data: Union[str, uuid.UUID], schema: avro.schema.UUIDSchema) -> Union[None, uuid.UUID]:
+    def _parse_uuid(self, data: Union[str, uuid.UUID], schema: "avro.schema.UUIDSchema") -> Union[None, uuid.UUID]:
         """
         Parse a UUID string as a Python UUID object
         """
@@ -447,7 +609,7 @@ class _ObjectAdapter(_Adapter):
             # malformed strings would raise ValueErrors if they can't be cast as a UUID.
             return None
 
-    def _parse_date(self, data: Union[datetime.date, int, str], schema: avro.schema.DateSchema) -> datetime.date:
+    def _parse_date(self, data: Union[datetime.date, int, str], schema: "avro.schema.DateSchema") -> datetime.date:
         """
         Parse the int logical type "date".
 
@@ -459,13 +621,13 @@ class _ObjectAdapter(_Adapter):
             # if it was Avro. So this is useful only in combination with serializing using ``datetime_type=int``.
             return datetime.datetime.fromtimestamp(data / 1e3, tz=datetime.timezone.utc).date()
         elif isinstance(data, str):
-            return dateutil.parser.isoparse(data).date()
+            return _parse_iso_datetime(data).date()
         else:
             # Deserialization to date object handled by Avro deserializer
             return data
 
     def _parse_timestamp_millis(
-        self, data: Union[datetime.datetime, int, str], schema: avro.schema.TimestampMillisSchema
+        self, data: Union[datetime.datetime, int, str], schema: "avro.schema.TimestampMillisSchema"
     ) -> datetime.datetime:
         """
         Parse the long logical type "millis".
@@ -478,39 +640,54 @@ class _ObjectAdapter(_Adapter):
             # serializing using ``datetime_type=int``.
             return datetime.datetime.fromtimestamp(data / 1e3, tz=datetime.timezone.utc)
         elif isinstance(data, str):
-            return dateutil.parser.isoparse(data)
+            return _parse_iso_datetime(data)
         else:
             # Deserialization to datetime object handled by Avro deserializer
             return data
 
-    def _parse_array(self, data: Array, schema: avro.schema.ArraySchema) -> List[Any]:
+    def _parse_array(self, data: Array, schema: "avro.schema.ArraySchema") -> List[Any]:
         """Parse an array/list schema"""
-        data = [self._parse(elem, schema.items) for elem in data]
-        return data
-
-    def _parse_union(self, data: Basic, schema: avro.schema.UnionSchema) -> Any:
+        items_schema = schema.items
+        parser = self._parsers_by_schema.get(type(items_schema))
+        # Primitive (non-logical) schema types are dispatched to the primitive parser
+        if parser is None or (parser is _ObjectAdapter._parse_primitive and items_schema.type != "string"):
+            return list(data)  # Items are taken as is, no need to parse them one by one
+        return [parser(self, item, items_schema) for item in data]
+
+    def _parse_union(self, data: Basic, schema: "avro.schema.UnionSchema") -> Any:
         """Parse a union schema trying the union branches one by one until the data fits"""
 
-        # Rank the branch schemas by best matching then by position in the union
-        scores_and_position = sorted(
-            (-py_adapter._schema.match(s, data), position)  # Negative for best matched first
-            for position, s in enumerate(schema.schemas)
-        )
-        # Remove branch schemas that do not match at all
-        scores_and_position = [(s, p) for (s, p) in scores_and_position if s != 0]
+        # Rank the matching branch schemas by best matching then by position in the union. Branch schemas that do not
+        # match at all are dropped.
+        match_schema = py_adapter._schema.match
+        branch_schemas = schema.schemas
+        scores = (match_schema(s, data) for s in branch_schemas)
+        scores_and_position = [
+            (-score, position) for position, score in enumerate(scores) if score  # Negative for best matched first
+        ]
+        if not scores_and_position:
+            # If none of the schemas matched the data at all
+            raise DataTypeError(data, schema)
+
+        # Typically the best matched schema is the right one, so we try that first without sorting all branch schemas
+        best = min(scores_and_position)
+        try:
+            # Recursively parse data using best matched schema
+            return self._parse(data, branch_schemas[best[1]])
+        except (TypeError, KeyError):
+            # If record parsing fails, we try the next best schemas
+            scores_and_position.remove(best)
 
-        for _, position in scores_and_position:
+        for _, position in sorted(scores_and_position):
             try:
-                # Recursively parse data using best matched schema
-                return self._parse(data, schema.schemas[position])
+                return self._parse(data, branch_schemas[position])
             except (TypeError, KeyError):
-                # If record parsing fails, we try the next best schema
                 continue
         else:
-            # If none of the schemas matched the data at all
+            # If none of the matched schemas can parse the data
             raise DataTypeError(data, schema)
 
-    def _parse_enum(self, data: str, schema: avro.schema.EnumSchema) -> Any:
+    def _parse_enum(self, data: str, schema: "avro.schema.EnumSchema") -> Any:
         """Parse an enum schema"""
         enum_class = self._data_class(schema)
         if enum_class:
@@ -518,7 +695,7 @@ class _ObjectAdapter(_Adapter):
         else:  # TODO: remove this logic once we do proper writer vs reader schema resolution
             return None
 
-    def _parse_record(self, data: Record, schema: avro.schema.RecordSchema) -> Any:
+    def _parse_record(self, data: Record, schema: "avro.schema.RecordSchema") -> Any:
         """
         Parse a record/object schema
 
@@ -528,9 +705,8 @@ class _ObjectAdapter(_Adapter):
         if not data_class:  # TODO: remove this logic once we do proper writer vs reader schema resolution
             return None
 
-        obj_kwargs = {
-            field.name: self._parse(data[field.name], field.type) for field in schema.fields if field.name in data
-        }
+        parse = self._parse
+        obj_kwargs = {field.name: parse(data[field.name], field.type) for field in schema.fields if field.name in data}
         factories = [
             self._obj_using_init,  # For proper dataclasses, this should work always
             self._obj_set_attrs,  # If a consumer has old dataclass code, there may be additional fields in data
@@ -565,14 +741,18 @@ class _ObjectAdapter(_Adapter):
         fields afterwards
         """
         # First inspect the data_class.__init__, find keyword only params vs the rest
-        pos_args_names, kw_arg_names = _constructor_params(data_class)
-        # Any other params that are in the payload but not in data_class.__init__
-        remaining_arg_names = [name for name in kwargs if name not in pos_args_names and name not in kw_arg_names]
-
-        # Take the corresponding parameter values from the payload
+        pos_args_names, pos_args_names_set, kw_arg_names = _constructor_params(data_class)
+
+        # Take the corresponding parameter values from the payload, in a single pass. Any other params that are in the
+        # payload but not in data_class.__init__ are remaining args.
+        kw_args = {}
+        remaining_args = {}
+        for name, value in kwargs.items():
+            if name in kw_arg_names:
+                kw_args[name] = value
+            elif name not in pos_args_names_set:
+                remaining_args[name] = value
         pos_args = [kwargs[name] for name in pos_args_names if name in kwargs]
-        kw_args = {name: kwargs[name] for name in kw_arg_names if name in kwargs}
-        remaining_args = {name: kwargs[name] for name in remaining_arg_names}
 
         # Construct the object using data_class.__init__
         obj = data_class(*pos_args, **kw_args)
@@ -587,7 +767,7 @@ class _ObjectAdapter(_Adapter):
             if hasattr(obj, field):  # Set fields that exist only
                 setattr(obj, field, value)
 
-    def _data_class(self, schema: Union[avro.schema.RecordSchema, avro.schema.EnumSchema]) -> Optional[Type]:
+    def _data_class(self, schema: Union["avro.schema.RecordSchema", "avro.schema.EnumSchema"]) -> Optional[Type]:
         """
         Return the corresponding Python class for a schema
 
@@ -595,13 +775,10 @@ class _ObjectAdapter(_Adapter):
         schema's namespace or, optionally, from an schema attribute like ``pyModule``.
         """
         module_name = cast(str, schema.props.get(self.module_schema_attribute, schema.namespace))
-        try:
-            return getattr(importlib.import_module(module_name), schema.name)
-        except AttributeError:  # TODO: remove this logic once we do proper writer vs reader schema resolution
-            logger.warning("Failed to import class '%s.%s'", module_name, schema.name)
-            return None
+        return _import_class(module_name, schema.name)
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def _import_attribute(dotted_name: str) -> Any:
         """Import and return attribute from a module, e.g. a class"""
         module_name, class_name = dotted_name.rsplit(".", 1)
@@ -609,23 +786,96 @@ class _ObjectAdapter(_Adapter):
         return getattr(module, class_name)
 
 
-@memoization.cached(max_size=100)
-def _constructor_params(data_class):
-    """Inspect __init__'s signature for a class and return (positional only params, other params)"""
+def _import_class(module_name: str, class_name: str) -> Optional[Type]:
+    """
+    Import and return a class from a module or return None if the module does not have the class
+
+    Only classes which could be imported are cached. A missing class is looked up (and a warning logged) every time, as
+    it may still be defined later.
+    """
+    try:
+        return _import_existing_class(module_name, class_name)
+    except AttributeError:  # TODO: remove this logic once we do proper writer vs reader schema resolution
+        logger.warning("Failed to import class '%s.%s'", module_name, class_name)
+        return None
+
+
+@functools.lru_cache(maxsize=1024)
+def _import_existing_class(module_name: str, class_name: str) -> Type:
+    """Import and return a class from a module, cached by module and class name"""
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def _parse_iso_datetime(data: str) -> datetime.datetime:
+    """Parse an ISO 8601 formatted date or date/time string"""
+    try:
+        # Implemented in C, but supports all ISO 8601 formats only from Python 3.11
+        return datetime.datetime.fromisoformat(data)
+    except ValueError:
+        import dateutil.parser
+
+        return dateutil.parser.isoparse(data)
+
+
+@functools.lru_cache(maxsize=512)
+def _dataclass_fields(data_class: Type) -> Tuple[Tuple[Tuple[str, Callable[[Any], Any]], ...], FrozenSet[str]]:
+    """
+    Return the fields of a dataclass as tuples of (field name, field getter) and the names of JSON logical type fields
+
+    Field meta data is resolved once per class as we would otherwise inspect it for every object we convert.
+    """
+    fields = dataclasses.fields(data_class)
+    json_field_names = frozenset(
+        # Retrieve dataclass field meta data relevant to current pkg
+        f.name
+        for f in fields
+        if (f.metadata.get(__package__) or {}).get("logical_type", "") == "json"
+    )
+    return tuple((f.name, operator.attrgetter(f.name)) for f in fields), json_field_names
+
+
+@memoization.cached(max_size=256)
+def _py_type_schema(py_type: Type) -> "avro.schema.Schema":
+    """
+    Generate and parse the Avro schema for a Python class
+
+    Schemas are cached by Python class as this is expensive. Use :func:`clear_schema_cache` if classes are redefined at
+    runtime.
+    """
+    import avro.schema
+    import py_avro_schema as pas
+
+    try:
+        # TODO: expose options as necessary
+        return avro.schema.parse(
+            pas.generate(py_type, options=pas.Option.LOGICAL_JSON_STRING | pas.Option.MILLISECONDS).decode("utf-8")
+        )
+    except pas.TypeNotSupportedError:
+        raise TypeError(f"{py_type} not supported by py-adapter since it is not supported by py-avro-schema")
+
+
+@memoization.cached(max_size=1024)
+def _constructor_params(data_class: Type) -> Tuple[Tuple[str, ...], FrozenSet[str], FrozenSet[str]]:
+    """
+    Inspect __init__'s signature for a class and return (positional only params, positional only params as a set, other
+    params)
+    """
     signature_params = inspect.signature(data_class.__init__).parameters
     pos_args_names = [
         name for name, param in signature_params.items() if param.kind == inspect.Parameter.POSITIONAL_ONLY
     ]
     kw_arg_names = [name for name, param in signature_params.items() if name not in pos_args_names]
     kw_arg_names.pop(0)  # Remove `self`, assuming self is not a positional only param!
-    return pos_args_names, kw_arg_names
+    return tuple(pos_args_names), frozenset(pos_args_names), frozenset(kw_arg_names)
 
 
 class DataTypeError(TypeError):
     """Data not compatible with the schema error"""
 
-    def __init__(self, data: Any, schema: avro.schema.Schema) -> None:
+    def __init__(self, data: Any, schema: "avro.schema.Schema") -> None:
         """Data not compatible with the schema error"""
+        import py_adapter._schema
+
         old_debug_validate = py_adapter._schema._DEBUG_VALIDATE
         py_adapter._schema._DEBUG_VALIDATE = True  # Patch avro package
         try:
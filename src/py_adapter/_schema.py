@@ -18,26 +18,29 @@ The logic is used only to pick the best matching schema from a union.
 
 import datetime
 import sys
+import threading
 from decimal import Decimal
-from struct import Struct
-from typing import Any
+from typing import Any, Callable, Collection, Dict, FrozenSet
 
 import avro.constants
 import avro.schema
 
+#: Whether to print validation details to stderr, enabled temporarily when raising a data type error
 _DEBUG_VALIDATE = False
-_debug_validate_indent = 0
+#: Per-thread state for printing validation details, currently the indentation only
+_debug_state = threading.local()
 
-INT_MIN_VALUE = -(1 << 31)
-INT_MAX_VALUE = (1 << 31) - 1
 LONG_MIN_VALUE = -(1 << 63)
 LONG_MAX_VALUE = (1 << 63) - 1
 
-STRUCT_FLOAT = Struct("<f")  # big-endian float
-STRUCT_DOUBLE = Struct("<d")  # big-endian double
-STRUCT_SIGNED_SHORT = Struct(">h")  # big-endian signed short
-STRUCT_SIGNED_INT = Struct(">i")  # big-endian signed int
-STRUCT_SIGNED_LONG = Struct(">q")  # big-endian signed long
+# Logical types as module constants, saving attribute lookups when matching
+_DATE = avro.constants.DATE
+_DECIMAL = avro.constants.DECIMAL
+_TIME_MICROS = avro.constants.TIME_MICROS
+_TIME_MILLIS = avro.constants.TIME_MILLIS
+_TIMESTAMP_LOGICAL_TYPES = frozenset([avro.constants.TIMESTAMP_MILLIS, avro.constants.TIMESTAMP_MICROS])
+
+_UNION_TYPES = frozenset(["union", "error_union"])
 
 
 def match(expected_schema: avro.schema.Schema, datum: Any) -> float:
@@ -48,36 +51,40 @@ def match(expected_schema: avro.schema.Schema, datum: Any) -> float:
     Values between 0 and 1 are used for record schemas where certain fields might be omitted from the data or where
     extra fields are provided.
     """
-    global _DEBUG_VALIDATE
-    global _debug_validate_indent
+    if _DEBUG_VALIDATE:
+        return _match_debug(expected_schema, datum)
+    expected_type = expected_schema.type
+    if datum is None and expected_type not in _UNION_TYPES:
+        return float(expected_type == "null")  # Fast path for null values, which match null schemas only
+    return _match[expected_type](expected_schema, datum)
+
+
+def _match_debug(expected_schema: avro.schema.Schema, datum: Any) -> float:
+    """Same as :func:`match`, but printing validation details to stderr"""
+    indent = getattr(_debug_state, "indent", 0)
     expected_type = expected_schema.type
     name = getattr(expected_schema, "name", "")
     if name:
         name = " " + name
     if expected_type in ("array", "map", "union", "record"):
-        if _DEBUG_VALIDATE:
-            print(
-                "{!s}{!s}{!s}: {!s} {{".format(
-                    " " * _debug_validate_indent, expected_schema.type, name, type(datum).__name__
-                ),
-                file=sys.stderr,
-            )
-            _debug_validate_indent += 2
+        print(
+            "{!s}{!s}{!s}: {!s} {{".format(" " * indent, expected_schema.type, name, type(datum).__name__),
+            file=sys.stderr,
+        )
+        _debug_state.indent = indent + 2
+        try:
             if datum is not None and not datum:
-                print("{!s}<Empty>".format(" " * _debug_validate_indent), file=sys.stderr)
-        result = _match[expected_type](expected_schema, datum)
-        if _DEBUG_VALIDATE:
-            _debug_validate_indent -= 2
-            print("{!s}}} -> {!s}".format(" " * _debug_validate_indent, result), file=sys.stderr)
+                print("{!s}<Empty>".format(" " * (indent + 2)), file=sys.stderr)
+            result = _match[expected_type](expected_schema, datum)
+        finally:
+            _debug_state.indent = indent
+        print("{!s}}} -> {!s}".format(" " * indent, result), file=sys.stderr)
     else:
         result = _match[expected_type](expected_schema, datum)
-        if _DEBUG_VALIDATE:
-            print(
-                "{!s}{!s}{!s}: {!s} -> {!s}".format(
-                    " " * _debug_validate_indent, expected_schema.type, name, type(datum).__name__, result
-                ),
-                file=sys.stderr,
-            )
+        print(
+            "{!s}{!s}{!s}: {!s} -> {!s}".format(" " * indent, expected_schema.type, name, type(datum).__name__, result),
+            file=sys.stderr,
+        )
     return result
 
 
@@ -95,64 +102,203 @@ def _match_record(schema: avro.schema.RecordSchema, datum: Any) -> float:
     """
     if not isinstance(datum, dict):
         return 0.0
+    return _match_fields(schema, datum)
 
+
+def _match_fields(schema: avro.schema.RecordSchema, provided_fields: Collection[str]) -> float:
+    """Return the degree to which given field names match the fields of a record schema"""
     # TODO: the original validation function also recursively validated the data for each field. Need to decide whether
     # that is necessary here or not.
-    provided_fields = datum.keys()
-    schema_fields = {f.name for f in schema.fields}
+    schema_fields = _field_names(schema)
     # This is a rather arbitrary scheme for determining "best" match. It does not consider optional vs required fields.
     # It needs to penalize extra fields certainly.
-    return len(provided_fields & schema_fields) / len(provided_fields | schema_fields)
+    common_count = len(schema_fields.intersection(provided_fields))
+    all_count = len(provided_fields) + len(schema_fields) - common_count
+    return common_count / all_count if all_count else 1.0  # Empty data for a record without fields
+
+
+def _field_names(schema: avro.schema.RecordSchema) -> FrozenSet[str]:
+    """
+    Return the names of the fields of a record schema
+
+    The names are stored on the schema object itself. Schemas hash by their JSON fingerprint, which makes them expensive
+    dictionary keys.
+    """
+    try:
+        return schema._py_adapter_field_names  # type: ignore[attr-defined]
+    except AttributeError:
+        field_names = frozenset(f.name for f in schema.fields)
+        schema._py_adapter_field_names = field_names  # type: ignore[attr-defined]
+        return field_names
+
+
+def _match_union(schema: avro.schema.UnionSchema, datum: Any) -> float:
+    """
+    Return the degree to which given data matches the best matching branch schema of a union
+
+    This stops at the first branch that fits perfectly.
+    """
+    if datum is None:
+        return float(any(branch.type == "null" for branch in schema.schemas))  # Fast path for optional fields
+    # Data keys are matched against each record branch schema, so we hash them once only
+    provided_fields = frozenset(datum) if isinstance(datum, dict) else None
+    best = 0.0
+    for branch in schema.schemas:
+        if _DEBUG_VALIDATE:
+            result = _match_debug(branch, datum)
+        elif provided_fields is not None and branch.type == "record":
+            result = _match_fields(branch, provided_fields)
+        else:
+            # Dispatch directly, saving a call to match() for each branch
+            result = _match[branch.type](branch, datum)
+        if result == 1.0:
+            return result
+        if result > best:
+            best = result
+    return best
+
 
+def _match_null(schema: avro.schema.Schema, datum: Any) -> float:
+    """Return whether given data matches a null schema"""
+    return float(datum is None)
 
-_match = {
-    "null": lambda schema, datum: float(datum is None),
-    "boolean": lambda schema, datum: float(isinstance(datum, bool)),
-    "string": lambda schema, datum: float(
+
+def _match_boolean(schema: avro.schema.Schema, datum: Any) -> float:
+    """Return whether given data matches a boolean schema"""
+    return float(isinstance(datum, bool))
+
+
+def _match_string(schema: avro.schema.Schema, datum: Any) -> float:
+    """Return whether given data matches a string schema, including JSON data for the logical type "json" """
+    if type(datum) is str:  # Fast path for the most common case, see below for subclasses
+        return 1.0
+    return float(
         isinstance(datum, str) or (isinstance(datum, (dict, list)) and schema.get_prop("logicalType") == "json")
-    ),
-    "bytes": lambda schema, datum: float(
-        (isinstance(datum, bytes))
-        or (isinstance(datum, Decimal) and getattr(schema, "logical_type", None) == avro.constants.DECIMAL)
-    ),
-    "int": lambda schema, datum: float(
-        (isinstance(datum, int) and (LONG_MIN_VALUE <= datum <= LONG_MAX_VALUE))
-        or (
-            getattr(schema, "logical_type", None) == avro.constants.DATE
-            and (
-                isinstance(datum, datetime.date)  # Dates olready deserialized
-                or (
-                    isinstance(datum, str) and len(datum) == 10 and len(datum.split("-")) == 3
-                )  # Dates as ISO strings, 1970-12-31
-            )
-        )
-        or (getattr(schema, "logical_type", None) == avro.constants.TIME_MILLIS and isinstance(datum, datetime.time))
-    ),
-    "long": lambda schema, datum: float(
-        (isinstance(datum, int))
-        and (LONG_MIN_VALUE <= datum <= LONG_MAX_VALUE)
-        or (isinstance(datum, datetime.time) and getattr(schema, "logical_type", None) == avro.constants.TIME_MICROS)
-        or (
-            (isinstance(datum, datetime.datetime) and _is_timezone_aware_datetime(datum) or isinstance(datum, str))
-            and getattr(schema, "logical_type", None)
-            in (avro.constants.TIMESTAMP_MILLIS, avro.constants.TIMESTAMP_MICROS)
+    )
+
+
+def _match_bytes(schema: avro.schema.Schema, datum: Any) -> float:
+    """Return whether given data matches a bytes schema, including decimals"""
+    if type(datum) is bytes:
+        return 1.0
+    return float(
+        (isinstance(datum, bytes)) or (isinstance(datum, Decimal) and getattr(schema, "logical_type", None) == _DECIMAL)
+    )
+
+
+def _match_int(schema: avro.schema.Schema, datum: Any) -> float:
+    """Return whether given data matches an int schema, including dates and times"""
+    if isinstance(datum, int):  # Logical types below do not apply to ints, including subclasses such as bool
+        return float(LONG_MIN_VALUE <= datum <= LONG_MAX_VALUE)
+    logical_type = getattr(schema, "logical_type", None)
+    if logical_type == _DATE:
+        return float(
+            isinstance(datum, datetime.date)  # Dates olready deserialized
+            or (isinstance(datum, str) and len(datum) == 10 and len(datum.split("-")) == 3)  # Dates as ISO strings
         )
-    ),
-    "float": lambda schema, datum: float(isinstance(datum, (int, float))),
-    "fixed": lambda schema, datum: float(
+    return float(logical_type == _TIME_MILLIS and isinstance(datum, datetime.time))
+
+
+def _match_long(schema: avro.schema.Schema, datum: Any) -> float:
+    """Return whether given data matches a long schema, including timestamps and times"""
+    if isinstance(datum, int):  # Logical types below do not apply to ints, including subclasses such as bool
+        return float(LONG_MIN_VALUE <= datum <= LONG_MAX_VALUE)
+    logical_type = getattr(schema, "logical_type", None)
+    if isinstance(datum, datetime.time):
+        return float(logical_type == _TIME_MICROS)
+    return float(
+        (isinstance(datum, datetime.datetime) and _is_timezone_aware_datetime(datum) or isinstance(datum, str))
+        and logical_type in _TIMESTAMP_LOGICAL_TYPES
+    )
+
+
+def _match_float(schema: avro.schema.Schema, datum: Any) -> float:
+    """Return whether given data matches a float or double schema"""
+    datum_type = type(datum)
+    if datum_type is float or datum_type is int:
+        return 1.0
+    return float(isinstance(datum, (int, float)))
+
+
+def _match_fixed(schema: avro.schema.FixedSchema, datum: Any) -> float:
+    """Return whether given data matches a fixed schema, including decimals"""
+    return float(
         (isinstance(datum, bytes) and len(datum) == schema.size)
-        or (isinstance(datum, Decimal) and getattr(schema, "logical_type", None) == avro.constants.DECIMAL)
-    ),
-    "enum": lambda schema, datum: float(datum in schema.symbols),
-    "array": lambda schema, datum: float(isinstance(datum, list) and all(match(schema.items, item) for item in datum)),
-    "map": lambda schema, datum: float(
-        isinstance(datum, dict)
-        and all(isinstance(key, str) for key in datum)
-        and all(match(schema.values, value) for value in datum.values())
-    ),
-    "union": lambda schema, datum: float(any(match(branch, datum) for branch in schema.schemas)),
+        or (isinstance(datum, Decimal) and getattr(schema, "logical_type", None) == _DECIMAL)
+    )
+
+
+def _match_enum(schema: avro.schema.EnumSchema, datum: Any) -> float:
+    """Return whether given data is one of the symbols of an enum schema"""
+    if type(datum) is str:
+        return float(datum in _symbols(schema))
+    return float(datum in schema.symbols)  # Anything else, including unhashable data
+
+
+def _symbols(schema: avro.schema.EnumSchema) -> FrozenSet[str]:
+    """
+    Return the symbols of an enum schema as a set
+
+    Like record field names, these are stored on the schema object itself.
+    """
+    try:
+        return schema._py_adapter_symbols  # type: ignore[attr-defined]
+    except AttributeError:
+        symbols = frozenset(schema.symbols)
+        schema._py_adapter_symbols = symbols  # type: ignore[attr-defined]
+        return symbols
+
+
+def _match_array(schema: avro.schema.ArraySchema, datum: Any) -> float:
+    """
+    Return whether given data is a list with items matching an array schema
+
+    Lists are assumed to be homogeneous, so only the first item is matched. This is sufficient to pick the best schema
+    from a union and avoids matching every item of large lists.
+    """
+    if not isinstance(datum, list):
+        return 0.0
+    if not datum:
+        return 1.0
+    items = schema.items
+    return float(bool(_match_debug(items, datum[0]) if _DEBUG_VALIDATE else _match[items.type](items, datum[0])))
+
+
+def _match_map(schema: avro.schema.MapSchema, datum: Any) -> float:
+    """
+    Return whether given data is a dict with keys and values matching a map schema
+
+    Like lists, dicts are assumed to be homogeneous, so only the first key and value are matched.
+    """
+    if not isinstance(datum, dict):
+        return 0.0
+    if not datum:
+        return 1.0
+    key, value = next(iter(datum.items()))
+    values = schema.values
+    return float(
+        isinstance(key, str)
+        and bool(_match_debug(values, value) if _DEBUG_VALIDATE else _match[values.type](values, value))
+    )
+
+
+#: Match functions by schema type
+_match: Dict[str, Callable[[Any, Any], float]] = {
+    "null": _match_null,
+    "boolean": _match_boolean,
+    "string": _match_string,
+    "bytes": _match_bytes,
+    "int": _match_int,
+    "long": _match_long,
+    "float": _match_float,
+    "double": _match_float,
+    "fixed": _match_fixed,
+    "enum": _match_enum,
+    "array": _match_array,
+    "map": _match_map,
+    "union": _match_union,
+    "error_union": _match_union,
     "record": _match_record,
+    "error": _match_record,
+    "request": _match_record,
 }
-_match["double"] = _match["float"]
-_match["error_union"] = _match["union"]
-_match["error"] = _match["request"] = _match["record"]
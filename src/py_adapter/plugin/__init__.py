@@ -17,7 +17,7 @@ import functools
 import logging
 import sys
 from collections.abc import Iterable, Iterator
-from typing import TYPE_CHECKING, BinaryIO, Type
+from typing import TYPE_CHECKING, Any, BinaryIO, Dict, Optional, Tuple, Type
 
 import pluggy
 
@@ -31,6 +31,12 @@ hook = pluggy.HookimplMarker(__package__)
 #: Decorator for plugin hook function specifications/signatures
 _hookspec = pluggy.HookspecMarker(__package__)
 
+#: Names of all hook specifications
+_HOOK_NAMES = ("serialize", "serialize_many", "deserialize", "deserialize_many")
+#: Sorted names of the plugins implementing each hook, populated when initializing the plugin manager and cleared when
+#: plugins are registered or unregistered afterwards
+_hook_plugin_names: Dict[str, Tuple[str, ...]] = {}
+
 
 @functools.lru_cache(maxsize=None)
 def manager() -> pluggy.PluginManager:
@@ -40,7 +46,8 @@ def manager() -> pluggy.PluginManager:
     Plugins are automatically loaded through (setuptools) entrypoints, group ``inference_server``.
     """
     logger.debug("Initializing plugin manager for '%s'", __package__)
-    manager_ = pluggy.PluginManager(__package__)
+    _clear_hook_cache()  # Any cached hooks belong to a previous manager
+    manager_ = _PluginManager(__package__)
     manager_.add_hookspecs(sys.modules[__name__])
 
     _load_default_plugins(manager_)
@@ -48,9 +55,39 @@ def manager() -> pluggy.PluginManager:
     logger.debug("Discovering plugins using entrypoint group '%s'", __package__)
     manager_.load_setuptools_entrypoints(group=__package__)
     logger.debug("Loaded plugins: %s", manager_.get_plugins())
+
+    for hook_name in _HOOK_NAMES:
+        _hook_plugin_names[hook_name] = _plugin_names(manager_, hook_name)
     return manager_
 
 
+class _PluginManager(pluggy.PluginManager):
+    """A plugin manager which clears cached hooks whenever plugins are registered or unregistered"""
+
+    def register(self, plugin: Any, name: Optional[str] = None) -> Optional[str]:
+        """Register a plugin and clear cached hooks"""
+        plugin_name = super().register(plugin, name=name)
+        _clear_hook_cache()
+        return plugin_name
+
+    def unregister(self, plugin: Any = None, name: Optional[str] = None) -> Any:
+        """Unregister a plugin and clear cached hooks"""
+        plugin = super().unregister(plugin=plugin, name=name)
+        _clear_hook_cache()
+        return plugin
+
+
+def _clear_hook_cache() -> None:
+    """Clear cached hook callers and plugin names as the registered plugins have changed"""
+    plugin_hook.cache_clear()
+    _hook_plugin_names.clear()
+
+
+def _plugin_names(manager_: pluggy.PluginManager, hook_name: str) -> Tuple[str, ...]:
+    """Return the sorted names of the plugins implementing a given hook"""
+    return tuple(sorted(impl.plugin_name for impl in getattr(manager_.hook, hook_name).get_hookimpls()))
+
+
 def _load_default_plugins(manager_: pluggy.PluginManager) -> None:
     """Load plugins that are packaged with py-adapter"""
     from py_adapter.plugin import _avro, _csv, _json
@@ -65,15 +102,23 @@ def _load_default_plugins(manager_: pluggy.PluginManager) -> None:
         manager_.register(plugin, name=name)
 
 
+@functools.lru_cache(maxsize=None)
 def plugin_hook(plugin_name: str, hook_name: str) -> pluggy.HookCaller:
     """
     Return a hook (caller) for a single named plugin and hook name
 
+    Hooks are cached by plugin and hook name. The cache is cleared whenever plugins are registered with or unregistered
+    from the manager.
+
     :param plugin_name: The name of the plugin to return the hook for
     :param hook_name:   The name of the hook function
     """
     pm = manager()
-    all_plugins_except_this_one = (p for name, p in pm.list_name_plugin() if name != plugin_name)
+    plugin = pm.get_plugin(plugin_name)
+    if plugin is None:
+        raise InvalidFormat(plugin_name=plugin_name, hook_name=hook_name)
+    # Pluggy only supports removing plugins from a hook, not selecting a single plugin
+    all_plugins_except_this_one = [p for p in pm.get_plugins() if p is not plugin]
     hook_caller = pm.subset_hook_caller(hook_name, remove_plugins=all_plugins_except_this_one)
     if not hook_caller.get_hookimpls():
         raise InvalidFormat(plugin_name=plugin_name, hook_name=hook_name)
@@ -87,7 +132,11 @@ class InvalidFormat(ValueError):
         """Initialize error with custom message"""
         pm = manager()
         if not pm.get_plugin(plugin_name):
-            plugins_for_hook = sorted(impl.plugin_name for impl in getattr(pm.hook, hook_name).get_hookimpls())
+            # Plugins are typically registered when initializing the manager only, so we use the names determined then
+            plugin_names = _hook_plugin_names.get(hook_name)
+            if plugin_names is None:
+                plugin_names = _plugin_names(pm, hook_name)
+            plugins_for_hook = list(plugin_names)
             msg = (
                 f"A plugin for serialization format '{plugin_name}' is not available. Installed plugins/formats are: "
                 f"{plugins_for_hook}."
@@ -108,6 +157,8 @@ def serialize(obj: "py_adapter.Basic", stream: BinaryIO, py_type: Type, writer_s
     Although we write to the stream, we also return the stream from this function. We need to return something to avoid
     pluggy thinking the hook is not implemented.
 
+    Implementations should not flush the stream, flushing is left to the caller.
+
     :param obj:           Python object to serialize
     :param stream:        File-like object to serialize data to
     :param py_type:       Original Python class associated with the basic object
@@ -127,6 +178,8 @@ def serialize_many(
     Although we write to the stream, we also return the stream from this function. We need to return something to avoid
     pluggy thinking the hook is not implemented.
 
+    Implementations should not flush the stream, flushing is left to the caller.
+
     :param objs:          Python objects to serialize
     :param stream:        File-like object to serialize data to
     :param py_type:       Original Python class associated with the basic object
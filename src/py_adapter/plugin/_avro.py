@@ -17,12 +17,18 @@ import functools
 from collections.abc import Iterable, Iterator
 from typing import BinaryIO, Type
 
+import fastavro.read
 import fastavro.types
+import fastavro.write
+import memoization
 import orjson
 
 import py_adapter
 import py_adapter.plugin
 
+#: Avro schemas larger than this (in bytes) are not canonicalized before parsing
+_CANONICAL_SCHEMA_MAX_SIZE = 4 * 1024
+
 
 @py_adapter.plugin.hook
 def serialize(obj: py_adapter.Basic, stream: BinaryIO, py_type: Type, writer_schema: bytes) -> BinaryIO:
@@ -36,12 +42,9 @@ def serialize(obj: py_adapter.Basic, stream: BinaryIO, py_type: Type, writer_sch
     :param py_type:       Original Python class associated with the basic object
     :param writer_schema: Avro schema to serialize the data with, as JSON bytes.
     """
-    import fastavro.write
-
     writer_schema = writer_schema or _default_schema(py_type)
     schema_obj = _parse_fastavro_schema(writer_schema)
     fastavro.write.schemaless_writer(stream, schema=schema_obj, record=obj)
-    stream.flush()
     return stream
 
 
@@ -57,12 +60,9 @@ def serialize_many(objs: Iterable[py_adapter.Basic], stream: BinaryIO, py_type:
     :param py_type:       Original Python class associated with the basic object
     :param writer_schema: Avro schema to serialize the data with, as JSON bytes.
     """
-    import fastavro.write
-
     writer_schema = writer_schema or _default_schema(py_type)
     schema_obj = _parse_fastavro_schema(writer_schema)
     fastavro.write.writer(stream, schema=schema_obj, records=objs)
-    stream.flush()
     return stream
 
 
@@ -77,8 +77,6 @@ def deserialize(stream: BinaryIO, py_type: Type, writer_schema: bytes, reader_sc
     :param reader_schema: Avro schema to deserialize the data with, as JSON bytes. The reader schema should be
                           compatible with the writer schema.
     """
-    import fastavro.read
-
     writer_schema = writer_schema or _default_schema(py_type)
     writer_schema_obj = _parse_fastavro_schema(writer_schema)
     reader_schema_obj = _parse_fastavro_schema(reader_schema) if reader_schema else None
@@ -101,16 +99,15 @@ def deserialize_many(
     :param reader_schema: Avro schema to deserialize the data with, as JSON bytes. The reader schema should be
                           compatible with the writer schema.
     """
-    import fastavro.read
-
     # TODO: make it fail if writer_schema is provided?
     reader_schema_obj = _parse_fastavro_schema(reader_schema) if reader_schema else None
     basic_objs = fastavro.read.reader(stream, reader_schema=reader_schema_obj)
     return basic_objs  # type: ignore[return-value]
 
 
+@memoization.cached(max_size=64)
 def _default_schema(py_type: Type) -> bytes:
-    """Generate an Avro schema for a given Python type"""
+    """Generate an Avro schema for a given Python type, cached by type"""
     import py_avro_schema as pas
 
     # JSON as string matches default argument in to_basic_type function
@@ -121,4 +118,14 @@ def _default_schema(py_type: Type) -> bytes:
 @functools.lru_cache(maxsize=100)
 def _parse_fastavro_schema(json_data: bytes) -> fastavro.types.Schema:
     """Parse an Avro schema (JSON bytes) into a fastavro-internal representation"""
+    schema_data = orjson.loads(json_data)
+    if len(json_data) > _CANONICAL_SCHEMA_MAX_SIZE:
+        return fastavro.parse_schema(schema_data)
+    # Share parsed schemas between JSON documents which differ only by formatting or key order
+    return _parse_canonical_fastavro_schema(orjson.dumps(schema_data, option=orjson.OPT_SORT_KEYS))
+
+
+@functools.lru_cache(maxsize=100)
+def _parse_canonical_fastavro_schema(json_data: bytes) -> fastavro.types.Schema:
+    """Parse an Avro schema (compact JSON bytes with sorted keys) into a fastavro-internal representation"""
     return fastavro.parse_schema(orjson.loads(json_data))
@@ -13,8 +13,12 @@
 CSV serializer/deserializer **py-adapter** plugin
 """
 
+import codecs
+import csv
+import functools
 import io
-from typing import BinaryIO, Iterable, Iterator
+import operator
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, Sequence, Tuple
 
 import more_itertools
 
@@ -41,22 +45,57 @@ def serialize_many(objs: Iterable[py_adapter.Basic], stream: BinaryIO) -> Binary
     :param objs:   Python objects to serialize
     :param stream: File-like object to serialize data to
     """
-    import csv
-
-    text_stream = io.StringIO(newline="")  # csv modules writes as text
-    (first_obj,), objs = more_itertools.spy(objs)  # this fails if the iterable is empty
+    if isinstance(objs, (list, tuple)):  # For example when serializing a single object
+        first_obj = objs[0]  # this fails if the sequence is empty
+    else:
+        (first_obj,), objs = more_itertools.spy(objs)  # this fails if the iterable is empty
     assert isinstance(first_obj, dict), "CSV serializer supports 'record' types only."
-    csv_writer = csv.DictWriter(text_stream, fieldnames=first_obj.keys())
-    csv_writer.writeheader()
-    csv_writer.writerows(objs)  # type:ignore[arg-type]  #  We know it's a dict
-    text_stream.flush()
-    text_stream.seek(0)
-
-    stream.write(text_stream.read().encode("utf-8"))
-    stream.flush()
+    # csv modules writes as text, encoded straight into the binary stream. The stream writer only requires the stream to
+    # have a write method.
+    text_stream = codecs.getwriter("utf-8")(stream)
+    fieldnames = tuple(first_obj.keys())
+    csv_writer = csv.writer(text_stream)
+    csv_writer.writerow(fieldnames)
+    csv_writer.writerows(_rows(objs, fieldnames))  # type: ignore[arg-type]  # We know these are dicts
     return stream
 
 
+def _rows(objs: Iterable[Dict[str, Any]], fieldnames: Tuple[str, ...]) -> Iterator[Sequence]:
+    """
+    Return the values of records as rows in the order of the given field names, like :class:`csv.DictWriter` does
+
+    Records with fields not in the field names raise a :class:`ValueError` and missing fields are written as empty
+    values.
+
+    :param objs:       Records to convert
+    :param fieldnames: Names of the record fields, typically the fields of the first record
+    """
+    fieldnames_set = frozenset(fieldnames)
+    row_getter = _row_getter(fieldnames)
+    for obj in objs:
+        # Records typically share the same fields, in which case we can use the fast getter
+        if obj.keys() == fieldnames_set:
+            yield row_getter(obj)
+            continue
+        extra_fields = obj.keys() - fieldnames_set
+        if extra_fields:
+            raise ValueError("dict contains fields not in fieldnames: " + ", ".join(repr(f) for f in extra_fields))
+        yield [obj.get(name, "") for name in fieldnames]
+
+
+@functools.lru_cache(maxsize=32)
+def _row_getter(fieldnames: Tuple[str, ...]) -> Callable[[Any], Sequence]:
+    """
+    Return a function which returns the values of a record in the order of the given field names
+
+    :param fieldnames: Names of the record fields
+    """
+    if len(fieldnames) == 1:  # itemgetter with a single item does not return a tuple
+        (name,) = fieldnames
+        return lambda obj: (obj[name],)
+    return operator.itemgetter(*fieldnames)
+
+
 @py_adapter.plugin.hook
 def deserialize(stream: BinaryIO) -> py_adapter.Basic:
     """
@@ -75,8 +114,13 @@ def deserialize_many(stream: BinaryIO) -> Iterator[py_adapter.Basic]:
 
     :param stream: File-like object to deserialize
     """
-    import csv
-
-    text_stream = io.StringIO(stream.read().decode("utf-8"))
-    csv_reader = csv.DictReader(text_stream)
-    return csv_reader
+    if not isinstance(stream, io.IOBase):
+        # Text wrappers require a full file object, so we read any other file-like object in one go
+        yield from csv.DictReader(io.StringIO(stream.read().decode("utf-8")))
+        return
+    # Decode and parse the stream row by row as we go
+    text_stream = io.TextIOWrapper(stream, encoding="utf-8", newline="")
+    try:
+        yield from csv.DictReader(text_stream)
+    finally:
+        text_stream.detach()  # Do not close the binary stream when the wrapper is garbage collected
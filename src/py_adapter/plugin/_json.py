@@ -13,9 +13,12 @@
 JSON serializer/deserializer **py-adapter** plugin
 """
 
+import io
 from collections.abc import Iterable, Iterator
 from typing import BinaryIO
 
+import orjson
+
 import py_adapter
 import py_adapter.plugin
 
@@ -28,11 +31,8 @@ def serialize(obj: py_adapter.Basic, stream: BinaryIO) -> BinaryIO:
     :param obj:    Python object to serialize
     :param stream: File-like object to serialize data to
     """
-    import orjson
-
     data = orjson.dumps(obj)
     stream.write(data)
-    stream.flush()
     return stream
 
 
@@ -41,14 +41,14 @@ def serialize_many(objs: Iterable[py_adapter.Basic], stream: BinaryIO) -> Binary
     """
     Serialize multiple Python objects of basic types as Newline Delimited JSON (NDJSON).
 
+    Each object is written to the stream as soon as it is serialized, including a terminating newline character.
+    Buffering of the writes is left to the stream.
+
     :param objs:   Python objects to serialize
     :param stream: File-like object to serialize data to
     """
-    import orjson
-
-    data = b"\n".join(orjson.dumps(obj) for obj in objs)
-    stream.write(data)
-    stream.flush()
+    for obj in objs:
+        stream.write(orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE))
     return stream
 
 
@@ -59,8 +59,6 @@ def deserialize(stream: BinaryIO) -> py_adapter.Basic:
 
     :param stream: File-like object to deserialize
     """
-    import orjson
-
     return orjson.loads(stream.read())
 
 
@@ -71,7 +69,18 @@ def deserialize_many(stream: BinaryIO) -> Iterator[py_adapter.Basic]:
 
     :param stream: File-like object to deserialize
     """
-    import orjson
-
-    lines = stream.read().splitlines()
-    return (orjson.loads(line) for line in lines)
+    if not isinstance(stream, io.IOBase):
+        # Line iteration requires a full file object, so we read any other file-like object in one go
+        yield from (orjson.loads(line) for line in stream.read().splitlines())
+        return
+    if not isinstance(stream, io.RawIOBase):
+        # Read the stream line by line as we go, orjson ignores the line endings
+        yield from (orjson.loads(line) for line in stream)
+        return
+    # Raw streams read lines one byte at a time, so we buffer them. The raw stream is left open once we are done.
+    buffered_stream = io.BufferedReader(stream)
+    try:
+        yield from (orjson.loads(line) for line in buffered_stream)
+    finally:
+        if not buffered_stream.closed:  # Unless the caller closed the raw stream already
+            buffered_stream.detach()
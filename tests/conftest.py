@@ -142,9 +142,13 @@ def ship_obj():
     return ship
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def ship_dict():
-    """Do not compute this from ship_obj as we want to be able to assert against them both"""
+    """
+    Do not compute this from ship_obj as we want to be able to assert against them both
+
+    This is shared between tests, tests must not modify it.
+    """
     return {
         "cargo": {
             "description": "Barrels of rum",
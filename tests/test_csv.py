@@ -15,6 +15,7 @@ Test script for CSV serialization/deserialization
 
 import dataclasses
 import datetime
+import io
 from typing import Optional
 
 import pytest
@@ -53,6 +54,40 @@ def test_serialize_many_records(simple_ship):
     assert objs_out == objs_in
 
 
+@dataclasses.dataclass
+class NameOnlyShip:
+    name: str
+
+
+def test_serialize_many_records_single_field():
+    objs_in = [NameOnlyShip(name="Elvira"), NameOnlyShip(name="Gloria")]
+    data = py_adapter.serialize_many(objs_in, format="CSV")
+    assert data.splitlines() == [b"name", b"Elvira", b"Gloria"]
+    objs_out = list(py_adapter.deserialize_many(data, NameOnlyShip, format="CSV"))
+    assert objs_out == objs_in
+
+
+def test_serialize_many_records_missing_field():
+    objs_in = [{"name": "Elvira", "build_on": "1970-12-31"}, {"name": "Gloria"}]
+    data = py_adapter.serialize_many(objs_in, format="CSV")
+    assert data.splitlines() == [b"name,build_on", b"Elvira,1970-12-31", b"Gloria,"]
+
+
+def test_serialize_many_records_extra_field():
+    objs_in = [{"name": "Elvira"}, {"name": "Gloria", "is_tidal": True}]
+    with pytest.raises(ValueError) as excinfo:
+        py_adapter.serialize_many(objs_in, format="CSV")
+    assert "dict contains fields not in fieldnames: 'is_tidal'" in str(excinfo.value)
+
+
+def test_deserialize_many_from_stream_leaves_stream_open(simple_ship):
+    data = py_adapter.serialize_many([simple_ship, simple_ship], format="CSV")
+    stream = io.BytesIO(data)
+    objs_out = list(py_adapter.deserialize_many_from_stream(stream, SimpleShip, format="CSV"))
+    assert objs_out == [simple_ship, simple_ship]
+    assert not stream.closed
+
+
 @pytest.mark.xfail(reason="Not supported")
 def test_serialize_many_no_records():
     objs_in = []
@@ -61,3 +96,34 @@ def test_serialize_many_no_records():
     assert data.splitlines() == expected_lines
     objs_out = list(py_adapter.deserialize_many(data, SimpleShip, format="CSV"))
     assert objs_out == objs_in
+
+
+class WriteOnlyStream:
+    """A minimal file-like object which only supports writing"""
+
+    def __init__(self):
+        self.data = b""
+
+    def write(self, data):
+        self.data += data
+        return len(data)
+
+
+class ReadOnlyStream:
+    """A minimal file-like object which only supports reading"""
+
+    def __init__(self, data):
+        self.data = data
+
+    def read(self):
+        data, self.data = self.data, b""
+        return data
+
+
+def test_serialize_many_minimal_streams(simple_ship):
+    objs_in = [simple_ship, simple_ship]
+    stream = WriteOnlyStream()
+    py_adapter.serialize_many_to_stream(objs_in, stream, format="CSV")
+    assert stream.data.splitlines() == [b"name,build_on", b"Elvira,1970-12-31", b"Elvira,1970-12-31"]
+    objs_out = list(py_adapter.deserialize_many_from_stream(ReadOnlyStream(stream.data), SimpleShip, format="CSV"))
+    assert objs_out == objs_in
@@ -10,16 +10,17 @@
 # specific language governing permissions and limitations under the License.
 
 
+import dataclasses
 import datetime
+import gc
 import io
 import json
 import pathlib
-import re
 import uuid
+from typing import List
 
-import avro.datafile
-import avro.io
 import avro.schema
+import fastavro
 import orjson
 import py_avro_schema as pas
 import pytest
@@ -39,6 +40,18 @@ def ship_schema(ship_class):
     )
 
 
+@pytest.fixture(scope="session")
+def ship_parser(ship_schema):
+    return py_adapter._ObjectAdapter(ship_schema)
+
+
+@pytest.fixture(scope="session")
+def ship_fastavro_schema(ship_class):
+    return fastavro.parse_schema(
+        orjson.loads(pas.generate(ship_class, options=pas.Option.LOGICAL_JSON_STRING | pas.Option.MILLISECONDS))
+    )
+
+
 @pytest.fixture(scope="session")
 def ship_adapter(ship_class):
     return py_adapter._ObjectAdapter.for_py_type(ship_class)
@@ -54,7 +67,14 @@ def port_adapter(port_class):
     return py_adapter._ObjectAdapter.for_py_type(port_class)
 
 
-def test_serde_with_avro(ship_schema, ship_obj):
+def test_object_adapter_schema_cached(ship_class):
+    schema = py_adapter._ObjectAdapter.for_py_type(ship_class).schema
+    assert py_adapter._ObjectAdapter.for_py_type(ship_class).schema is schema
+    py_adapter.clear_schema_cache()
+    assert py_adapter._ObjectAdapter.for_py_type(ship_class).schema is not schema
+
+
+def test_serde_with_avro(ship_parser, ship_fastavro_schema, ship_obj):
     """
     Round trip Avro serialization/deserialization test to demonstrate integration with Avro
     """
@@ -66,24 +86,19 @@ def test_serde_with_avro(ship_schema, ship_obj):
     # ship_dict["crew"][1]["role"] = "Chief mate"
 
     binary_data = io.BytesIO()
-    writer = avro.datafile.DataFileWriter(binary_data, avro.io.DatumWriter(writers_schema=ship_schema), ship_schema)
-    writer.append(ship_dict)
-    writer.flush()
-
-    reader = avro.datafile.DataFileReader(binary_data, avro.io.DatumReader())
-    read_dict = next(reader)
+    fastavro.schemaless_writer(binary_data, ship_fastavro_schema, ship_dict)
+    binary_data.seek(0)
+    read_dict = fastavro.schemaless_reader(binary_data, ship_fastavro_schema)
 
     # All that is required to parse the data again
-    parser = py_adapter._ObjectAdapter(ship_schema)
-    parsed_obj = parser.adapt(read_dict)
+    parsed_obj = ship_parser.adapt(read_dict)
 
     assert parsed_obj == ship_obj
 
 
-def test_serde_with_json(ship_schema, ship_obj):
-    """
-    Round trip JSON serialization/deserialization test to demonstrate integration with orjson
-    """
+@pytest.fixture
+def ship_json_data(ship_obj):
+    """Ship serialized as JSON using orjson, with extra attributes which are not in the class"""
     # This is all that is required to convert a dataclass to a dict which we can the load into the datum writer
     ship_dict = py_adapter.to_basic_type(ship_obj, datetime_type=int, json_type=dict)
     # These attributes are missing from the class object on purpose, for testing. Adding them here is fine since JSON
@@ -91,19 +106,26 @@ def test_serde_with_json(ship_schema, ship_obj):
     ship_dict["flag"] = "NLD"
     ship_dict["crew"][0]["role"] = "Master"
     ship_dict["crew"][1]["role"] = "Chief mate"
+    return orjson.dumps(ship_dict)
 
-    json_data = orjson.dumps(ship_dict)
-    read_dict = orjson.loads(json_data)
+
+def test_serialize_with_json(ship_json_data):
+    read_dict = orjson.loads(ship_json_data)
     assert isinstance(read_dict["departed_at"], int)
     assert isinstance(read_dict["sails"], dict)
+    assert read_dict["flag"] == "NLD"
+
 
-    parser = py_adapter._ObjectAdapter(ship_schema)
-    parsed_obj = parser.adapt(read_dict)
+def test_serde_with_json(ship_parser, ship_obj, ship_json_data):
+    """
+    Round trip JSON serialization/deserialization test to demonstrate integration with orjson
+    """
+    read_dict = orjson.loads(ship_json_data)
+    parsed_obj = ship_parser.adapt(read_dict)
 
     assert parsed_obj == ship_obj
     assert not hasattr(parsed_obj, "flag")
-    assert not hasattr(parsed_obj.crew[0], "role")
-    assert not hasattr(parsed_obj.crew[1], "role")
+    assert not any(hasattr(person, "role") for person in parsed_obj.crew)
 
 
 def test_serde_dict_only(ship_class, ship_obj):
@@ -117,23 +139,28 @@ def test_to_basic_type(ship_obj, ship_dict):
     assert adapted_ship_dict == ship_dict
 
 
-def test_to_basic_type_json_with_underscore_fields(ship_obj):
-    ship_obj.sails = {
-        "_main": {"type": "dacron"},
-    }
-    adapted_ship_dict = py_adapter.to_basic_type(ship_obj, json_type=dict)
+@pytest.fixture
+def ship_obj_with_private_sails(ship_obj):
+    """Ship with a private key in its JSON sails field, without modifying the ship object itself"""
+    return dataclasses.replace(
+        ship_obj,
+        sails={
+            "_main": {"type": "dacron"},
+        },
+    )
+
+
+def test_to_basic_type_json_with_underscore_fields(ship_obj_with_private_sails):
+    adapted_ship_dict = py_adapter.to_basic_type(ship_obj_with_private_sails, json_type=dict)
     assert adapted_ship_dict["sails"] == {
         "_main": {"type": "dacron"},
     }
 
 
-def test_to_basic_type_json_excl_private_fields(ship_obj):
-    ship_obj.sails = {
-        "_main": {"type": "dacron"},
-    }
+def test_to_basic_type_json_excl_private_fields(ship_obj_with_private_sails):
     adapter = py_adapter._DictAdapter(json_type=dict)
     adapter.incl_private_keys = False
-    adapted_ship_dict = adapter.adapt(ship_obj)
+    adapted_ship_dict = adapter.adapt(ship_obj_with_private_sails)
     assert adapted_ship_dict["sails"] == {}
 
 
@@ -159,19 +186,47 @@ def test_to_basic_type_obj_excl_private_fields():
     assert adapted_ship_dict.get("sails") is None
 
 
+def test_dict_adapter_subclass_adapt_method():
+    class UpperCaseAdapter(py_adapter._DictAdapter):
+        @staticmethod
+        def _adapt_method_name(data_type):
+            if data_type is str:
+                return "_adapt_upper_case"
+            return py_adapter._DictAdapter._adapt_method_name(data_type)
+
+        def _adapt_upper_case(self, data):
+            return data.upper()
+
+    assert py_adapter.to_basic_type("Elvira") == "Elvira"  # Base adapter first
+    assert UpperCaseAdapter().adapt("Elvira") == "ELVIRA"
+
+
 def test_from_basic_type(ship_obj, ship_dict, ship_class):
     adapted_ship_obj = py_adapter.from_basic_type(ship_dict, ship_class)
     assert adapted_ship_obj == ship_obj
 
 
+def test_from_basic_type_no_reference_cycles(ship_dict, ship_class):
+    py_adapter.from_basic_type(ship_dict, ship_class)  # Generate and cache the schema first
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(10):
+            py_adapter.from_basic_type(ship_dict, ship_class)
+        # Adapters should be freed by reference counting alone, without leaving garbage to collect
+        assert gc.collect() == 0
+    finally:
+        gc.enable()
+
+
 def test_from_basic_type_bad_json_string(ship_obj, ship_dict, ship_class):
-    ship_dict["sails"] = "{{not valid json}}"
+    ship_dict = {**ship_dict, "sails": "{{not valid json}}"}  # Copy, the fixture is shared between tests
     adapted_ship_obj = py_adapter.from_basic_type(ship_dict, ship_class)
     assert adapted_ship_obj.sails is None
 
 
 def test_from_basic_type_empty_json_string(ship_obj, ship_dict, ship_class):
-    ship_dict["sails"] = ""
+    ship_dict = {**ship_dict, "sails": ""}  # Copy, the fixture is shared between tests
     adapted_ship_obj = py_adapter.from_basic_type(ship_dict, ship_class)
     assert adapted_ship_obj.sails is None
 
@@ -202,39 +257,31 @@ def test_array_field(ship_adapter):
         ],
     }
     ship = ship_adapter.adapt(data)
-    assert len(ship.crew) == 2
-    assert ship.crew[0].name == "Florenz"
-    assert ship.crew[1].name == "Cara"
+    assert [person.name for person in ship.crew] == ["Florenz", "Cara"]
 
 
-def test_datetime_field(ship_adapter):
-    departure_time = datetime.datetime.now(tz=datetime.timezone.utc)
-    data = {
-        "name": "Elvira",
-        "departed_at": departure_time,
-    }
-    ship = ship_adapter.adapt(data)
-    assert ship.departed_at == departure_time
+def test_array_of_primitives():
+    data = [1, 2]
+    adapted_data = py_adapter.from_basic_type(data, List[int])
+    assert adapted_data == [1, 2]
+    assert adapted_data is not data
 
 
-def test_datetime_field_from_millis(ship_adapter):
-    departure_time = datetime.datetime.now(tz=datetime.timezone.utc).replace(microsecond=123_000)  # Use milli precision
+@pytest.mark.parametrize(
+    "departed_at",
+    [
+        pytest.param(datetime.datetime(2020, 10, 28, 13, 30, 0, 123_000, tzinfo=datetime.timezone.utc), id="datetime"),
+        pytest.param(1603891800123, id="millis"),
+        pytest.param("2020-10-28T13:30:00.123000+00:00", id="iso_string"),
+    ],
+)
+def test_datetime_field(ship_adapter, departed_at):
     data = {
         "name": "Elvira",
-        "departed_at": int(departure_time.timestamp() * 1e3),  # Use millisecond precision
+        "departed_at": departed_at,
     }
     ship = ship_adapter.adapt(data)
-    assert ship.departed_at == departure_time
-
-
-def test_datetime_field_from_iso_string(ship_adapter):
-    departure_time = datetime.datetime.now(tz=datetime.timezone.utc)
-    data = {
-        "name": "Elvira",
-        "departed_at": departure_time.isoformat(),
-    }
-    ship = ship_adapter.adapt(data)
-    assert ship.departed_at == departure_time
+    assert ship.departed_at == datetime.datetime(2020, 10, 28, 13, 30, 0, 123_000, tzinfo=datetime.timezone.utc)
 
 
 def test_union_with_null(ship_adapter):
@@ -303,22 +350,87 @@ def test_union_records_ambiguous(ship_adapter):
     assert not hasattr(ship.engine, "voltage")  # Adapter took first matching schema: DieselEngine!
 
 
-def test_field_not_in_schema(ship_adapter):
-    data = {
-        "name": "Elvira",
-        "home_port": "Rotterdam",
-    }
-    ship = ship_adapter.adapt(data)
-    assert not hasattr(ship, "home_port")
-
-
-def test_field_not_in_class(ship_adapter):
+def test_match_union_best_branch():
+    schema = avro.schema.parse(
+        json.dumps(
+            [
+                "null",
+                {"type": "record", "name": "A", "fields": [{"name": "a", "type": "int"}, {"name": "b", "type": "int"}]},
+                {"type": "record", "name": "B", "fields": [{"name": "a", "type": "int"}]},
+            ]
+        )
+    )
+    assert py_adapter._schema.match(schema, None) == 1.0
+    assert py_adapter._schema.match(schema, {"a": 1}) == 1.0
+    assert py_adapter._schema.match(schema, {"b": 1}) == 0.5
+    assert py_adapter._schema.match(schema, "a") == 0.0
+
+
+@pytest.mark.parametrize(
+    "schema_type, datum, expected",
+    [
+        ("null", None, 1.0),
+        ("string", None, 0.0),
+        (["int", "string"], None, 0.0),
+        ("int", 1, 1.0),
+        ("int", True, 1.0),
+        ("int", 1 << 63, 0.0),
+        ("long", -(1 << 63), 1.0),
+        ("float", 1, 1.0),
+        ("double", 1.5, 1.0),
+        ("double", False, 1.0),
+        ("double", "1.5", 0.0),
+        ("string", "a", 1.0),
+        ("string", b"a", 0.0),
+        ("bytes", b"a", 1.0),
+        ({"type": "int", "logicalType": "date"}, datetime.date(1970, 1, 1), 1.0),
+        ({"type": "int", "logicalType": "date"}, "1970-01-01", 1.0),
+        ({"type": "int", "logicalType": "date"}, datetime.time(), 0.0),
+        ({"type": "long", "logicalType": "timestamp-millis"}, "1970-01-01T00:00:00+00:00", 1.0),
+        ({"type": "long", "logicalType": "timestamp-millis"}, datetime.datetime(1970, 1, 1), 0.0),
+        ({"type": "long"}, "1970-01-01T00:00:00+00:00", 0.0),
+    ],
+)
+def test_match_primitive(schema_type, datum, expected):
+    schema = avro.schema.parse(json.dumps(schema_type))
+    assert py_adapter._schema.match(schema, datum) == expected
+
+
+@pytest.mark.parametrize(
+    "schema_type, datum, expected",
+    [
+        ({"type": "array", "items": "int"}, [], 1.0),
+        ({"type": "array", "items": "int"}, [1, 2], 1.0),
+        ({"type": "array", "items": "int"}, ["1", "2"], 0.0),
+        ({"type": "array", "items": "int"}, {"a": 1}, 0.0),
+        ({"type": "map", "values": "int"}, {}, 1.0),
+        ({"type": "map", "values": "int"}, {"a": 1}, 1.0),
+        ({"type": "map", "values": "int"}, {1: 1}, 0.0),
+        ({"type": "map", "values": "int"}, {"a": "1"}, 0.0),
+        ({"type": "enum", "name": "E", "symbols": ["A", "B"]}, "B", 1.0),
+        ({"type": "enum", "name": "E", "symbols": ["A", "B"]}, "C", 0.0),
+        ({"type": "enum", "name": "E", "symbols": ["A", "B"]}, ["A"], 0.0),
+    ],
+)
+def test_match_complex(schema_type, datum, expected):
+    schema = avro.schema.parse(json.dumps(schema_type))
+    assert py_adapter._schema.match(schema, datum) == expected
+
+
+@pytest.mark.parametrize(
+    "field_name, value",
+    [
+        pytest.param("home_port", "Rotterdam", id="not_in_schema"),
+        pytest.param("flag", "NLD", id="not_in_class"),
+    ],
+)
+def test_field_not_in_schema_or_class(ship_adapter, field_name, value):
     data = {
         "name": "Elvira",
-        "flag": "NLD",
+        field_name: value,
     }
     ship = ship_adapter.adapt(data)
-    assert not hasattr(ship, "flag")
+    assert not hasattr(ship, field_name)
 
 
 def test_field_not_in_class_keep_optional_fields(ship_adapter):
@@ -353,8 +465,7 @@ def test_non_dataclass(port_adapter):
     port = port_adapter.adapt(data)
     assert port.name == "Rotterdam"
     assert port.country == "NLD"
-    assert pytest.approx(51.981443) == port.latitude
-    assert pytest.approx(-4.080739) == port.longitude
+    assert pytest.approx((51.981443, -4.080739)) == (port.latitude, port.longitude)
 
 
 def test_non_dataclass_extra_arg(port_adapter):
@@ -368,8 +479,7 @@ def test_non_dataclass_extra_arg(port_adapter):
     port = port_adapter.adapt(data)
     assert port.name == "Rotterdam"
     assert port.country == "NLD"
-    assert pytest.approx(51.981443) == port.latitude
-    assert pytest.approx(-4.080739) == port.longitude
+    assert pytest.approx((51.981443, -4.080739)) == (port.latitude, port.longitude)
     assert not hasattr(port, "is_tidal")
 
 
@@ -398,7 +508,7 @@ def test_non_importable_data_type(caplog):
         "country.avsc",  # There is no corresponding Python class for this
         "goods_with_country.avsc",
     ]
-    json_datas = [json.loads((pathlib.Path(__file__).parent / file_name).read_text()) for file_name in file_names]
+    json_datas = [orjson.loads((pathlib.Path(__file__).parent / file_name).read_bytes()) for file_name in file_names]
     names = avro.schema.Names()
     for json_data in json_datas:
         avro.schema.make_avsc_object(json_data, names=names)
@@ -416,6 +526,9 @@ def test_non_importable_data_type(caplog):
     assert goods.weight_kg == pytest.approx(5100.5)
     assert not hasattr(goods, "country")
     assert "Failed to import class 'conftest.Country'" in caplog.text
+    caplog.clear()
+    goods_adapter.adapt(data)
+    assert "Failed to import class 'conftest.Country'" in caplog.text  # Missing classes are not cached
 
 
 def test_datetime_no_conversion():
@@ -430,6 +543,21 @@ def test_datetime_int():
     assert py_adapter.from_basic_type(expected_serialization, datetime.datetime) == departure_time
 
 
+def test_datetime_int_microseconds():
+    departure_time = datetime.datetime(2023, 6, 1, 0, 0, 0, 123_999, tzinfo=datetime.timezone.utc)
+    expected_serialization = 1_685_577_600_123  # Microseconds are truncated
+    assert py_adapter.to_basic_type(departure_time, datetime_type=int) == expected_serialization
+
+
+def test_datetime_int_many():
+    departure_times = [
+        datetime.datetime(1970, 1, 1, 0, 1, 0, tzinfo=datetime.timezone.utc),
+        datetime.datetime(2023, 6, 1, 0, 0, 0, 123_999, tzinfo=datetime.timezone.utc),
+    ] * 512
+    expected_serializations = [60 * 1_000, 1_685_577_600_123] * 512
+    assert list(py_adapter.to_basic_type_many(departure_times, datetime_type=int)) == expected_serializations
+
+
 def test_datetime_str():
     departure_time = datetime.datetime(1970, 1, 1, 0, 1, 0, tzinfo=datetime.timezone.utc)
     expected_serialization = "1970-01-01T00:01:00+00:00"
@@ -437,6 +565,11 @@ def test_datetime_str():
     assert py_adapter.from_basic_type(expected_serialization, datetime.datetime) == departure_time
 
 
+def test_datetime_str_utc_z():
+    departure_time = datetime.datetime(1970, 1, 1, 0, 1, 0, tzinfo=datetime.timezone.utc)
+    assert py_adapter.from_basic_type("1970-01-01T00:01:00Z", datetime.datetime) == departure_time
+
+
 def test_date_no_conversion():
     departure_time = datetime.date.today()
     assert py_adapter.to_basic_type(departure_time) == departure_time
@@ -475,11 +608,9 @@ def test_unsupported_type():
     sail = Sail(name="spinnaker")
     expected_serialization = {"name": "spinnaker"}
     assert py_adapter.to_basic_type(sail) == expected_serialization  # This works
-    with pytest.raises(
-        TypeError,
-        match=re.escape(
-            "<class 'test_py_adapter.test_unsupported_type.<locals>.Sail'> not supported by py-adapter since it is not "
-            "supported by py-avro-schema"
-        ),
-    ):
+    with pytest.raises(TypeError) as excinfo:
         py_adapter.from_basic_type(expected_serialization, Sail)  # This does not work
+    assert (
+        "<class 'test_py_adapter.test_unsupported_type.<locals>.Sail'> not supported by py-adapter since it is not "
+        "supported by py-avro-schema"
+    ) in str(excinfo.value)
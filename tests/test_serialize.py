@@ -9,26 +9,44 @@
 # "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 import dataclasses
+import enum
 import io
-import re
+from typing import Any
 
 import fastavro.read
+import orjson
 import py_avro_schema as pas
 import pytest
 
 import py_adapter
 import py_adapter.plugin
+from py_adapter.plugin._avro import (
+    _parse_canonical_fastavro_schema,
+    _parse_fastavro_schema,
+)
+
+#: The ship object serialized as JSON
+SHIP_JSON = (
+    b'{"name":"Elvira","id":"00000000-0000-0000-0000-000000000001","type":"SAILING_VESSEL","crew":[{"name":'
+    b'"Florenz"},{"name":"Cara"}],"cargo":{"description":"Barrels of rum","weight_kg":5100.5},"departed_at":'
+    b'"2020-10-28T13:30:00+00:00","build_on":"1970-12-31","engine":null,"sails":'
+    b'"{\\"main\\":{\\"type\\":\\"dacron\\"},\\"jib\\":\\"white\\"}","tags":["keelboat"]}'
+)
+
+
+@pytest.fixture(scope="session")
+def ship_writer_schema(ship_class):
+    """Avro schema for the ship class, generated once"""
+    return pas.generate(ship_class, options=pas.Option.LOGICAL_JSON_STRING | pas.Option.MILLISECONDS)
 
 
 def test_invalid_format(ship_obj):
-    with pytest.raises(
-        py_adapter.plugin.InvalidFormat,
-        match=re.escape(
-            "A plugin for serialization format 'does not exist' is not available. Installed plugins/formats are: "
-            "['Avro', 'CSV', 'JSON']."
-        ),
-    ):
+    with pytest.raises(py_adapter.plugin.InvalidFormat) as excinfo:
         py_adapter.serialize(ship_obj, format="does not exist")
+    assert (
+        "A plugin for serialization format 'does not exist' is not available. Installed plugins/formats are: "
+        "['Avro', 'CSV', 'JSON']."
+    ) in str(excinfo.value)
 
 
 def test_plugin_without_hooks(ship_obj):
@@ -37,13 +55,34 @@ def test_plugin_without_hooks(ship_obj):
 
     pm = py_adapter.plugin.manager()
     pm.register(PluginNoHooks, "BrokenFormat")
-    with pytest.raises(
-        py_adapter.plugin.InvalidFormat,
-        match=re.escape(
-            "The plugin for serialization format 'BrokenFormat' does not implement the required hook 'serialize'."
-        ),
-    ):
+    with pytest.raises(py_adapter.plugin.InvalidFormat) as excinfo:
         py_adapter.serialize(ship_obj, format="BrokenFormat")
+    assert (
+        "The plugin for serialization format 'BrokenFormat' does not implement the required hook 'serialize'."
+        in str(excinfo.value)
+    )
+
+
+def test_plugin_registered_after_first_use(ship_obj):
+    class PluginExtra:
+        """A plugin registered after the JSON hook has been used"""
+
+        @staticmethod
+        @py_adapter.plugin.hook
+        def serialize_many(objs, stream, py_type, writer_schema):
+            stream.write(b"EXTRA!")
+            return stream
+
+    data = py_adapter.serialize_many([ship_obj], format="JSON")
+    pm = py_adapter.plugin.manager()
+    pm.register(PluginExtra, "Extra")
+    try:
+        assert py_adapter.serialize_many([ship_obj], format="JSON") == data
+        assert py_adapter.serialize_many([ship_obj], format="Extra") == b"EXTRA!"
+    finally:
+        pm.unregister(name="Extra")
+    with pytest.raises(py_adapter.plugin.InvalidFormat):
+        py_adapter.serialize_many([ship_obj], format="Extra")
 
 
 def test_plugin_name_conflict(mocker):
@@ -62,21 +101,50 @@ def test_plugin_name_conflict(mocker):
 
 def test_serialize_json(ship_obj, ship_class):
     data = py_adapter.serialize(ship_obj, format="JSON")
-    expected_serialization = (
-        b'{"name":"Elvira","id":"00000000-0000-0000-0000-000000000001","type":"SAILING_VESSEL","crew":[{"name":'
-        b'"Florenz"},{"name":"Cara"}],"cargo":{"description":"Barrels of rum","weight_kg":5100.5},"departed_at":'
-        b'"2020-10-28T13:30:00+00:00","build_on":"1970-12-31","engine":null,"sails":'
-        b'"{\\"main\\":{\\"type\\":\\"dacron\\"},\\"jib\\":\\"white\\"}","tags":["keelboat"]}'
-    )
-    assert data == expected_serialization
+    assert data == SHIP_JSON
     obj_out = py_adapter.deserialize(data, ship_class, format="JSON")  # possibly auto-detect format
     assert obj_out == ship_obj
 
 
-def test_serialize_avro(ship_obj, ship_class):
-    writer_schema = pas.generate(ship_class, options=pas.Option.LOGICAL_JSON_STRING | pas.Option.MILLISECONDS)
-    data = py_adapter.serialize(ship_obj, format="Avro", writer_schema=writer_schema)
-    obj_out = py_adapter.deserialize(data, ship_class, format="Avro", writer_schema=writer_schema)
+@dataclasses.dataclass
+class Berth:
+    port: Any  # Not a dataclass
+    _number: int = 1
+
+
+def test_serialize_json_same_as_basic_type(port_class):
+    berth = Berth(port=port_class("Rotterdam", latitude=51.981443, longitude=-4.080739))
+    berth.is_tidal = True  # Attributes which are not dataclass fields are ignored
+    data = py_adapter.serialize(berth, format="JSON")
+    assert data == (
+        b'{"port":{"name":"Rotterdam","country":"NLD","latitude":51.981443,"longitude":-4.080739},"_number":1}'
+    )
+    assert data == orjson.dumps(py_adapter.to_basic_type(berth))
+
+
+class Colour(str, enum.Enum):
+    RED = "red"
+
+
+class Key(str):
+    """A named string"""
+
+
+@pytest.mark.parametrize(
+    "obj, expected",
+    [
+        pytest.param({Colour.RED: 1}, b'{"red":1}', id="enum_key"),
+        pytest.param({Key("k"): 1}, b'{"k":1}', id="str_subclass_key"),
+    ],
+)
+def test_serialize_json_dict_key_types(obj, expected):
+    assert py_adapter.serialize(obj, format="JSON") == expected
+    assert py_adapter.serialize_many([obj], format="JSON") == expected + b"\n"
+
+
+def test_serialize_avro(ship_obj, ship_class, ship_writer_schema):
+    data = py_adapter.serialize(ship_obj, format="Avro", writer_schema=ship_writer_schema)
+    obj_out = py_adapter.deserialize(data, ship_class, format="Avro", writer_schema=ship_writer_schema)
     assert obj_out == ship_obj
 
 
@@ -86,17 +154,24 @@ def test_serialize_avro_automatic_writer_schema(ship_obj, ship_class):
     assert obj_out == ship_obj
 
 
+def test_serialize_avro_writer_schema_reformatted(ship_obj, ship_class, ship_writer_schema):
+    writer_schema_indented = orjson.dumps(orjson.loads(ship_writer_schema), option=orjson.OPT_INDENT_2)
+    data = py_adapter.serialize(ship_obj, format="Avro", writer_schema=ship_writer_schema)
+    obj_out = py_adapter.deserialize(data, ship_class, format="Avro", writer_schema=writer_schema_indented)
+    assert obj_out == ship_obj
+    assert _parse_fastavro_schema(writer_schema_indented) is _parse_fastavro_schema(ship_writer_schema)
+
+
 @dataclasses.dataclass
 class Ship:
     name: str
 
 
-def test_serialize_avro_reader_schema(ship_obj, ship_class):
-    writer_schema = pas.generate(ship_class, options=pas.Option.LOGICAL_JSON_STRING | pas.Option.MILLISECONDS)
+def test_serialize_avro_reader_schema(ship_obj, ship_class, ship_writer_schema):
     reader_schema = pas.generate(Ship, options=pas.Option.LOGICAL_JSON_STRING | pas.Option.MILLISECONDS)
-    data = py_adapter.serialize(ship_obj, format="Avro", writer_schema=writer_schema)
+    data = py_adapter.serialize(ship_obj, format="Avro", writer_schema=ship_writer_schema)
     obj_out = py_adapter.deserialize(
-        data, Ship, format="Avro", writer_schema=writer_schema, reader_schema=reader_schema
+        data, Ship, format="Avro", writer_schema=ship_writer_schema, reader_schema=reader_schema
     )
     assert isinstance(obj_out, Ship)
     assert obj_out.name == ship_obj.name
@@ -109,28 +184,22 @@ class Vessel:
     name: str
 
 
-def test_serialize_avro_reader_schema_incompatible(ship_obj, ship_class):
-    writer_schema = pas.generate(ship_class, options=pas.Option.LOGICAL_JSON_STRING | pas.Option.MILLISECONDS)
+def test_serialize_avro_reader_schema_incompatible(ship_obj, ship_class, ship_writer_schema):
     reader_schema = pas.generate(Vessel, options=pas.Option.LOGICAL_JSON_STRING | pas.Option.MILLISECONDS)
-    data = py_adapter.serialize(ship_obj, format="Avro", writer_schema=writer_schema)
+    data = py_adapter.serialize(ship_obj, format="Avro", writer_schema=ship_writer_schema)
     with pytest.raises(fastavro.read.SchemaResolutionError):
-        py_adapter.deserialize(data, Vessel, format="Avro", writer_schema=writer_schema, reader_schema=reader_schema)
+        py_adapter.deserialize(
+            data, Vessel, format="Avro", writer_schema=ship_writer_schema, reader_schema=reader_schema
+        )
 
 
-def test_serialize_stream_json(ship_obj, ship_class):
+@pytest.mark.parametrize("format", ["JSON", "Avro"])
+def test_serialize_stream(ship_obj, ship_class, ship_writer_schema, format):
+    writer_schema = ship_writer_schema if format == "Avro" else b""
     data = io.BytesIO()
-    py_adapter.serialize_to_stream(ship_obj, data, format="JSON")
+    py_adapter.serialize_to_stream(ship_obj, data, format=format, writer_schema=writer_schema)
     data.seek(0)
-    obj_out = py_adapter.deserialize_from_stream(data, ship_class, format="JSON")
-    assert obj_out == ship_obj
-
-
-def test_serialize_stream_avro(ship_obj, ship_class):
-    writer_schema = pas.generate(ship_class, options=pas.Option.LOGICAL_JSON_STRING | pas.Option.MILLISECONDS)
-    data = io.BytesIO()
-    py_adapter.serialize_to_stream(ship_obj, data, format="Avro", writer_schema=writer_schema)
-    data.seek(0)
-    obj_out = py_adapter.deserialize_from_stream(data, ship_class, format="Avro", writer_schema=writer_schema)
+    obj_out = py_adapter.deserialize_from_stream(data, ship_class, format=format, writer_schema=writer_schema)
     assert obj_out == ship_obj
 
 
@@ -141,14 +210,28 @@ def test_serialize_many_json(ship_obj, ship_class):
     assert objs_out == ship_objs
 
 
-def test_serialize_many_avro(ship_obj, ship_class):
-    writer_schema = pas.generate(ship_class, options=pas.Option.LOGICAL_JSON_STRING | pas.Option.MILLISECONDS)
+def test_serialize_many_json_lines(ship_obj):
     ship_objs = [ship_obj, ship_obj]
-    data = py_adapter.serialize_many(ship_objs, format="Avro", writer_schema=writer_schema)
+    data = py_adapter.serialize_many(ship_objs, format="JSON")
+    assert data == 2 * (SHIP_JSON + b"\n")
+
+
+def test_serialize_many_avro(ship_obj, ship_class, ship_writer_schema):
+    ship_objs = [ship_obj, ship_obj]
+    data = py_adapter.serialize_many(ship_objs, format="Avro", writer_schema=ship_writer_schema)
     objs_out = list(py_adapter.deserialize_many(data, ship_class, format="Avro"))
     assert objs_out == ship_objs
 
 
+def test_serialize_many_avro_parses_schema_once(ship_obj, ship_writer_schema, mocker):
+    _parse_fastavro_schema.cache_clear()
+    _parse_canonical_fastavro_schema.cache_clear()
+    parse_schema = mocker.spy(fastavro, "parse_schema")
+    py_adapter.serialize_many([ship_obj] * 16, format="Avro", writer_schema=ship_writer_schema)
+    py_adapter.serialize_many([ship_obj] * 16, format="Avro", writer_schema=ship_writer_schema)
+    assert parse_schema.call_count == 1
+
+
 def test_serialize_many_avro_automatic_writer_schema(ship_obj, ship_class):
     ship_objs = [ship_obj, ship_obj]
     data = py_adapter.serialize_many(ship_objs, format="Avro")
@@ -168,22 +251,62 @@ def test_serialize_many_avro_automatic_writer_schema_generator(ship_obj, ship_cl
     assert objs_out == ship_objs
 
 
-def test_serialize_many_stream_json(ship_obj, ship_class):
+@pytest.mark.parametrize("format", ["JSON", "Avro"])
+def test_serialize_many_stream(ship_obj, ship_class, ship_writer_schema, format):
+    writer_schema = ship_writer_schema if format == "Avro" else b""
     ship_objs = [ship_obj, ship_obj]
     data = io.BytesIO()
-    py_adapter.serialize_many_to_stream(ship_objs, data, format="JSON")
+    py_adapter.serialize_many_to_stream(ship_objs, data, format=format, writer_schema=writer_schema)
     data.seek(0)
-    objs_out = list(py_adapter.deserialize_many_from_stream(data, ship_class, format="JSON"))
+    objs_out = list(
+        py_adapter.deserialize_many_from_stream(data, ship_class, format=format, writer_schema=writer_schema)
+    )
     assert objs_out == ship_objs
 
 
-def test_serialize_many_stream_avro(ship_obj, ship_class):
-    writer_schema = pas.generate(ship_class, options=pas.Option.LOGICAL_JSON_STRING | pas.Option.MILLISECONDS)
+class ReadOnlyStream:
+    """A minimal file-like object which only supports reading"""
+
+    def __init__(self, data):
+        self.data = data
+
+    def read(self):
+        data, self.data = self.data, b""
+        return data
+
+
+def test_deserialize_many_json_minimal_stream(ship_obj, ship_class):
     ship_objs = [ship_obj, ship_obj]
-    data = io.BytesIO()
-    py_adapter.serialize_many_to_stream(ship_objs, data, format="Avro", writer_schema=writer_schema)
-    data.seek(0)
-    objs_out = list(
-        py_adapter.deserialize_many_from_stream(data, ship_class, format="Avro", writer_schema=writer_schema)
-    )
+    data = py_adapter.serialize_many(ship_objs, format="JSON")
+    objs_out = list(py_adapter.deserialize_many_from_stream(ReadOnlyStream(data), ship_class, format="JSON"))
+    assert objs_out == ship_objs
+
+
+def test_deserialize_many_json_closed_stream(ship_obj, ship_class):
+    data = io.BytesIO(py_adapter.serialize_many([ship_obj, ship_obj], format="JSON"))
+    objs_out = py_adapter.deserialize_many_from_stream(data, ship_class, format="JSON")
+    assert next(objs_out) == ship_obj
+    data.close()  # Objects are read as we go, so the stream must stay open until all are consumed
+    with pytest.raises(ValueError):
+        next(objs_out)
+
+
+def test_deserialize_many_json_unbuffered_file(ship_obj, ship_class, tmp_path):
+    path = tmp_path / "ships.json"
+    ship_objs = [ship_obj, ship_obj]
+    path.write_bytes(py_adapter.serialize_many(ship_objs, format="JSON"))
+    with open(path, "rb", buffering=0) as file:
+        objs_out = list(py_adapter.deserialize_many_from_stream(file, ship_class, format="JSON"))
+        assert not file.closed
+    assert objs_out == ship_objs
+
+
+def test_serialize_many_unbuffered_file(ship_obj, ship_class, tmp_path):
+    path = tmp_path / "ships.avro"
+    ship_objs = [ship_obj, ship_obj]
+    with open(path, "wb", buffering=0) as file:
+        py_adapter.serialize_many_to_stream(ship_objs, file, format="Avro")
+        assert not file.closed
+    with open(path, "rb") as file:
+        objs_out = list(py_adapter.deserialize_many_from_stream(file, ship_class, format="Avro"))
     assert objs_out == ship_objs